@@ -1,6 +1,64 @@
 import bpy
 from bpy.types import Operator
+from bpy.props import BoolProperty, IntProperty
+import time
 from .clean_modifiers import is_modifier_useless
+from .background_jobs import run_in_workers, append_datablocks, default_worker_count
+
+
+def modifiers_to_apply(obj, ignore_types):
+    """Names of the modifiers Apply Modifiers would apply on ``obj``, in stack order."""
+    to_apply = []
+    for mod in obj.modifiers:
+        # 1. Skip if hidden in viewport
+        if not mod.show_viewport:
+            continue
+        
+        # 2. Skip if in ignore list
+        if mod.type in ignore_types:
+            continue
+        
+        # 3. Skip if "useless" (broken or zero influence)
+        if is_modifier_useless(mod):
+            continue
+        
+        to_apply.append(mod.name)
+    return to_apply
+
+
+def can_apply_by_evaluation(obj, to_apply):
+    """True when the evaluated mesh equals the result of applying ``to_apply``:
+    every viewport-visible modifier is applied (hidden ones don't evaluate),
+    no shape keys (modifier_apply refuses those too) and local data."""
+    if obj.library or obj.data.library or obj.data.shape_keys:
+        return False
+    visible = [mod.name for mod in obj.modifiers if mod.show_viewport]
+    return visible == to_apply
+
+
+def bake_evaluated_mesh(obj, depsgraph):
+    """New mesh datablock holding the evaluated geometry of ``obj``."""
+    eval_obj = obj.evaluated_get(depsgraph)
+    return bpy.data.meshes.new_from_object(eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph)
+
+
+def swap_in_mesh(obj, baked, to_apply):
+    """Make ``baked`` the data of ``obj`` and drop the applied modifiers.
+
+    A mesh shared with other objects is left alone for them; ``obj`` just
+    gets its own baked copy.
+    """
+    for name in to_apply:
+        obj.modifiers.remove(obj.modifiers[name])
+
+    old_mesh = obj.data
+    old_name = old_mesh.name
+    obj.data = baked
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+        baked.name = old_name
+    return baked
+
 
 class REXTOOLS3_OT_ApplyModifiers(Operator):
     """Apply all modifiers on selected objects with an ignore list"""
@@ -9,6 +67,24 @@ class REXTOOLS3_OT_ApplyModifiers(Operator):
     bl_description = "Apply all modifiers from all selected objects, ignoring specified types"
     bl_options = {'REGISTER', 'UNDO'}
 
+    use_background: BoolProperty(
+        name="Background Workers",
+        description="Bake full modifier stacks in separate background Blender processes (for very large batches)",
+        default=False
+    )
+    batch_size: IntProperty(
+        name="Batch Size",
+        description="Objects per background worker",
+        default=100,
+        min=1
+    )
+    max_workers: IntProperty(
+        name="Workers",
+        description="Background processes running at the same time (0 = half the CPU cores)",
+        default=0,
+        min=0
+    )
+
     def invoke(self, context, event):
         settings = context.scene.rex_common_settings
         if len(settings.apply_modifiers_ignore_list) == 0:
@@ -28,41 +104,51 @@ class REXTOOLS3_OT_ApplyModifiers(Operator):
             return {'CANCELLED'}
 
         orig_mode = context.mode
+        orig_active = context.view_layer.objects.active
         if context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
 
         applied_total = 0
-        obj_count = 0
+        timings = []
+        failures = {}
 
+        # We need to collect names first because applying changes the stack
+        stacks = {}
         for obj in targets:
-            context.view_layer.objects.active = obj
-            
-            # We need to collect names first because applying changes the stack
-            to_apply = []
-            for mod in obj.modifiers:
-                # 1. Skip if hidden in viewport
-                if not mod.show_viewport:
-                    continue
-                
-                # 2. Skip if in ignore list
-                if mod.type in ignore_types:
-                    continue
-                
-                # 3. Skip if "useless" (broken or zero influence)
-                if is_modifier_useless(mod):
-                    continue
-                
-                to_apply.append(mod.name)
-
+            to_apply = modifiers_to_apply(obj, ignore_types)
             if to_apply:
-                obj_count += 1
-                for mod_name in to_apply:
-                    try:
-                        # modifier_apply works on the active object
-                        bpy.ops.object.modifier_apply(modifier=mod_name)
-                        applied_total += 1
-                    except Exception as e:
-                        self.report({'WARNING'}, f"Failed to apply {mod_name} on {obj.name}: {e}")
+                stacks[obj] = to_apply
+        baked_objects = [obj for obj, to_apply in stacks.items() if can_apply_by_evaluation(obj, to_apply)]
+
+        # Whole visible stack goes: bake everything first, then write back
+        if baked_objects:
+            if self.use_background:
+                baked = self.bake_in_workers(baked_objects, failures)
+            else:
+                baked = self.bake_in_process(context, baked_objects)
+            for obj, (mesh, seconds) in baked.items():
+                start = time.perf_counter()
+                swap_in_mesh(obj, mesh, stacks[obj])
+                applied_total += len(stacks[obj])
+                timings.append((obj.name, "evaluated", seconds + time.perf_counter() - start))
+
+        baked_set = set(baked_objects)
+        for obj, to_apply in stacks.items():
+            if obj in baked_set:
+                continue
+            start = time.perf_counter()
+            context.view_layer.objects.active = obj
+            for mod_name in to_apply:
+                try:
+                    # modifier_apply works on the active object
+                    bpy.ops.object.modifier_apply(modifier=mod_name)
+                    applied_total += 1
+                except Exception as e:
+                    self.report({'WARNING'}, f"Failed to apply {mod_name} on {obj.name}: {e}")
+            timings.append((obj.name, "per modifier", time.perf_counter() - start))
+
+        if orig_active and orig_active.name in context.view_layer.objects:
+            context.view_layer.objects.active = orig_active
 
         # Restore mode
         if orig_mode != context.mode:
@@ -71,9 +157,69 @@ class REXTOOLS3_OT_ApplyModifiers(Operator):
             except:
                 pass
 
-        self.report({'INFO'}, f"Applied {applied_total} modifiers across {obj_count} objects")
+        # Detailed console output
+        print("\n--- RexTools3 Apply Modifiers ---")
+        for name, path, seconds in timings:
+            print(f"Applied: {name} ({path}, {seconds * 1000:.1f} ms)")
+        for name, error in failures.items():
+            print(f"FAILED: {name} -> {error}")
+        print("---------------------------------\n")
+
+        msg = f"Applied {applied_total} modifiers across {len(timings)} objects"
+        if failures:
+            names = ", ".join(list(failures)[:5]) + (" ..." if len(failures) > 5 else "")
+            self.report({'WARNING'}, msg + f", {len(failures)} left unapplied: {names} (see console)")
+        else:
+            self.report({'INFO'}, msg)
         return {'FINISHED'}
 
+    def bake_in_process(self, context, objects):
+        """One depsgraph evaluation for all objects, then one baked mesh each."""
+        depsgraph = context.evaluated_depsgraph_get()
+        baked = {}
+        for obj in objects:
+            start = time.perf_counter()
+            baked[obj] = (bake_evaluated_mesh(obj, depsgraph), time.perf_counter() - start)
+        return baked
+
+    def bake_in_workers(self, objects, failures):
+        """Bake in background processes and append the resulting meshes.
+        Objects that fail stay untouched."""
+        baked = {}
+        by_name = {o.name: o for o in objects}
+
+        def collect(batch):
+            if batch.error:
+                for name in batch.names:
+                    failures[name] = batch.error
+                return
+            done = {n: r for n, r in batch.results.items() if r.get("ok")}
+            for name, result in batch.results.items():
+                if not result.get("ok"):
+                    failures[name] = result.get("error", "unknown error")
+            if not done or not batch.has_output:
+                return
+
+            names = list(done)
+            loaded = append_datablocks(batch.output, "meshes", [done[n]["data"] for n in names])
+            for name, mesh in zip(names, loaded):
+                if mesh is None:
+                    failures[name] = "result mesh missing"
+                    continue
+                # written with a fake user so it survives the worker's save
+                mesh.use_fake_user = False
+                # materials were stripped in the worker, relink the local ones
+                for mat_name in done[name]["materials"]:
+                    mesh.materials.append(bpy.data.materials.get(mat_name) if mat_name else None)
+                baked[by_name[name]] = (mesh, done[name]["time"])
+
+        run_in_workers(
+            'APPLY_MODIFIERS', objects, collect,
+            batch_size=self.batch_size,
+            max_workers=self.max_workers or default_worker_count(),
+        )
+        return baked
+
 
 class REXTOOLS3_OT_ApplyModifiersAddIgnore(Operator):
     bl_idname = "rextools3.apply_modifiers_add_ignore"
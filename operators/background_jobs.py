@@ -0,0 +1,139 @@
+import bpy
+import os
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+# Outside the auto-loaded packages, the add-on never imports it
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(__file__)), "workers", "background_worker.py")
+
+
+class WorkerBatch:
+    """One chunk of objects sent to a background Blender process."""
+
+    def __init__(self, index, names, folder):
+        self.index = index
+        self.names = names
+        self.spec = os.path.join(folder, f"batch_{index}.json")
+        self.output = os.path.join(folder, f"batch_{index}.blend")
+        self.report = os.path.join(folder, f"batch_{index}_report.json")
+        self.log = os.path.join(folder, f"batch_{index}.log")
+        self.results = {}
+        self.error = None
+        self.elapsed = 0.0
+        self.process = None
+        self.start = 0.0
+
+    @property
+    def has_output(self):
+        return os.path.exists(self.output)
+
+
+def chunked(items, size):
+    size = max(1, size)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def default_worker_count():
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def append_datablocks(path, attr, names):
+    """Append ``names`` from the ``attr`` collection (e.g. "meshes") of a .blend.
+    Returns the new datablocks in the same order (None where missing)."""
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        setattr(data_to, attr, list(names))
+    return list(getattr(data_to, attr))
+
+
+def run_in_workers(job, objects, on_batch, batch_size=25, max_workers=None, options=None, timeout=600.0):
+    """Run ``job`` (a key of the worker's JOBS) on ``objects`` in background Blender processes.
+
+    Objects are written once to a temporary .blend, split into batches and
+    processed by up to ``max_workers`` processes at a time. ``on_batch`` is
+    called on the main thread for every finished ``WorkerBatch`` while its
+    output file still exists. A crashed or timed-out worker only fails its
+    own batch. Blocks until every batch is done; progress is shown as
+    finished batches on the window manager's progress cursor and printed to
+    the console. Returns all batches.
+    """
+    max_workers = max_workers or default_worker_count()
+    folder = tempfile.mkdtemp(prefix="rextools3_")
+    wm = bpy.context.window_manager
+    progress = False
+    try:
+        source = os.path.join(folder, "input.blend")
+        bpy.data.libraries.write(source, set(objects), fake_user=True)
+
+        batches = []
+        for index, names in enumerate(chunked([o.name for o in objects], batch_size)):
+            batch = WorkerBatch(index, names, folder)
+            with open(batch.spec, "w") as f:
+                json.dump({
+                    "job": job,
+                    "input": source,
+                    "output": batch.output,
+                    "report": batch.report,
+                    "objects": names,
+                    "options": options or {},
+                }, f)
+            batches.append(batch)
+
+        wm.progress_begin(0, len(batches))
+        progress = True
+        finished = 0
+
+        pending = list(batches)
+        running = []
+        while pending or running:
+            while pending and len(running) < max_workers:
+                batch = pending.pop(0)
+                batch.start = time.perf_counter()
+                with open(batch.log, "w") as log:
+                    batch.process = subprocess.Popen(
+                        [bpy.app.binary_path, "--background", "--factory-startup",
+                         "--python", WORKER_SCRIPT, "--", batch.spec],
+                        stdout=log, stderr=subprocess.STDOUT,
+                    )
+                running.append(batch)
+
+            for batch in list(running):
+                code = batch.process.poll()
+                if code is None:
+                    if time.perf_counter() - batch.start < timeout:
+                        continue
+                    batch.process.kill()
+                    batch.process.wait()
+                    batch.error = f"timed out after {timeout:.0f}s"
+                running.remove(batch)
+                batch.elapsed = time.perf_counter() - batch.start
+                _read_report(batch, code)
+                on_batch(batch)
+                finished += 1
+                wm.progress_update(finished)
+                print(f"RexTools3 {job}: batch {finished}/{len(batches)} done ({batch.elapsed:.1f}s)")
+            time.sleep(0.05)
+
+        return batches
+    finally:
+        if progress:
+            wm.progress_end()
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def _read_report(batch, code):
+    if os.path.exists(batch.report):
+        with open(batch.report) as f:
+            batch.results = json.load(f).get("results", {})
+        return
+    if batch.error is None:
+        batch.error = f"worker exited with code {code}"
+        try:
+            with open(batch.log) as f:
+                tail = f.read().strip().splitlines()[-1:]
+            if tail:
+                batch.error += f": {tail[0]}"
+        except OSError:
+            pass
@@ -1,6 +1,58 @@
 import bpy
 from bpy.types import Operator
 
+# Handled by the chain builder itself, never copied from the template
+SKIP_PROPS = {'name', 'type', 'target', 'subtarget', 'influence', 'mute'}
+
+_writable_props = {}  # constraint type -> writable RNA property names
+
+
+def writable_constraint_props(con):
+    """Names of the settings that can be copied between constraints of this type.
+    Read from the RNA definition once per type."""
+    names = _writable_props.get(con.type)
+    if names is None:
+        names = _writable_props[con.type] = tuple(
+            prop.identifier for prop in con.bl_rna.properties
+            if not prop.is_readonly
+            and prop.type != 'COLLECTION'
+            and prop.identifier not in SKIP_PROPS
+            and prop.identifier != 'rna_type'
+        )
+    return names
+
+
+def constraint_settings(con):
+    """(name, value) of every copyable setting of ``con``, read once."""
+    settings = []
+    for name in writable_constraint_props(con):
+        value = getattr(con, name)
+        if hasattr(value, "__len__") and not isinstance(value, str) and not isinstance(value, bpy.types.ID):
+            value = tuple(value)  # arrays, copy instead of keeping a view on the template
+        settings.append((name, value))
+    return settings
+
+
+def selection_depths(selected_bones):
+    """Number of selected ancestors of every selected bone.
+
+    One pass over the parent chains: each bone is resolved once and later
+    chains stop at the first bone already known.
+    """
+    selected = {pb.name for pb in selected_bones}
+    above = {}  # bone name -> selected ancestors (all bones walked)
+
+    for pb in selected_bones:
+        chain = []
+        curr = pb
+        while curr is not None and curr.name not in above:
+            chain.append(curr)
+            curr = curr.parent
+        for bone in reversed(chain):
+            parent = bone.parent
+            above[bone.name] = 0 if parent is None else above[parent.name] + (parent.name in selected)
+    return {pb.name: above[pb.name] for pb in selected_bones}
+
 class REX_OT_InitChainConstraintTemplate(Operator):
     """Create a template constraint on the active bone to configure settings"""
     bl_idname = "rex.init_chain_constraint_template"
@@ -83,22 +135,9 @@ class REX_OT_ChainConstraintsAdder(Operator):
         armature = context.active_object
         selected_bones = context.selected_pose_bones
         
-        # Identify hierarchy within selection
-        selected_bone_names = [b.name for b in selected_bones]
-        
-        # Sort bones by hierarchy
-        # We can sort them by the number of parents they have in the selection
-        def get_selection_depth(pb):
-            depth = 0
-            curr = pb.parent
-            while curr:
-                if curr.name in selected_bone_names:
-                    depth += 1
-                curr = curr.parent
-            return depth
-
         # Sort selected bones: Root (depth 0) to Tip (depth N)
-        sorted_bones = sorted(selected_bones, key=get_selection_depth)
+        depths = selection_depths(selected_bones)
+        sorted_bones = sorted(selected_bones, key=lambda pb: depths[pb.name])
         
         if len(sorted_bones) < 2:
             self.report({'WARNING'}, "Select at least 2 connected bones")
@@ -128,27 +167,20 @@ class REX_OT_ChainConstraintsAdder(Operator):
         influence_step = props.influence_value
         num_constraints = len(pairs)
         
-        def copy_constraint_props(src, dst):
-            # List of attributes to skip (manually handled or internal)
-            skip = {'name', 'type', 'target', 'subtarget', 'influence', 'mute'}
-            for attr in dir(src):
-                if attr.startswith("_") or attr in skip:
-                    continue
-                try:
-                    setattr(dst, attr, getattr(src, attr))
-                except (AttributeError, TypeError):
-                    # Some attributes are read-only or not applicable
-                    pass
-
-        # Find template constraint
+        # Find template constraint, read its settings once for the whole chain
         template_con = context.active_pose_bone.constraints.get("REX_TEMPLATE")
+        settings = constraint_settings(template_con) if template_con else []
         
         for i, (pb, target_pb) in enumerate(pairs):
             con = pb.constraints.new(type=props.constraint_type)
             
             # Copy settings from template if it exists
-            if template_con:
-                copy_constraint_props(template_con, con)
+            for name, value in settings:
+                try:
+                    setattr(con, name, value)
+                except (AttributeError, TypeError, ValueError):
+                    # Not applicable in this context (e.g. enum items that depend on the target)
+                    pass
             
             con.target = armature
             con.subtarget = target_pb.name
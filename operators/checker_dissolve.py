@@ -1,16 +1,95 @@
 import bpy
 import bmesh
+from collections import deque
 from bpy.types import Operator, Panel
 from bpy.props import IntProperty, BoolProperty
-
-
-def _bm_from_context(context):
-    obj = context.active_object
-    if not obj or obj.type != 'MESH' or context.mode != 'EDIT_MESH':
-        return None, None
-    me = obj.data
-    bm = bmesh.from_edit_mesh(me)
-    return bm, me
+from .mesh_utils import SeedSnapshot, edit_mesh_objects, walk_edge_ring, walk_edge_loop
+
+
+def _edge_depths(candidates, starts):
+    """BFS depth of each candidate edge, stepping between edges that share a face.
+
+    Mirrors how select_nth walks an edge ring. Each connected group of
+    candidates without a start edge is walked from its lowest-index edge.
+    """
+    depth = {}
+    queue = deque()
+    for e in starts:
+        if e in candidates and e not in depth:
+            depth[e] = 0
+            queue.append(e)
+
+    pending = iter(sorted(candidates, key=lambda e: e.index))
+    while True:
+        while queue:
+            e = queue.popleft()
+            d = depth[e] + 1
+            for f in e.link_faces:
+                for fe in f.edges:
+                    if fe in candidates and fe not in depth:
+                        depth[fe] = d
+                        queue.append(fe)
+        start = next((e for e in pending if e not in depth), None)
+        if start is None:
+            return depth
+        depth[start] = 0
+        queue.append(start)
+
+
+def checker_dissolve_bmesh(bm, seeds, skip=1, nth=1, offset=0, use_ring=True):
+    """Ring → checker → loop → dissolve, in BMesh, with one dissolve_edges call.
+
+    ``seeds`` are the starting edges. With ``use_ring`` each seed's quad ring
+    is walked first, otherwise ``seeds`` themselves are the ring. Returns the
+    number of edges dissolved.
+    """
+    if use_ring:
+        candidates = set()
+        for e in seeds:
+            candidates.update(walk_edge_ring(e))
+        starts = seeds
+    else:
+        candidates = set(seeds)
+        active = bm.select_history.active
+        starts = [active] if isinstance(active, bmesh.types.BMEdge) else []
+
+    # same test as select_nth: the first ``skip`` steps of each period are deselected
+    period = skip + nth
+    kept = [e for e, d in _edge_depths(candidates, starts).items() if (d + offset) % period >= skip]
+
+    loop_edges = set()
+    for e in kept:
+        if e not in loop_edges:
+            loop_edges.update(walk_edge_loop(e)[0])
+
+    for e in candidates:
+        e.select_set(False)
+    if loop_edges:
+        bmesh.ops.dissolve_edges(bm, edges=list(loop_edges), use_verts=True, use_face_split=False)
+    bm.select_flush_mode()
+    return len(loop_edges)
+
+
+def checker_dissolve_objects(objects, skip=1, nth=1, offset=0, use_ring=True, seeds=None):
+    """Run ``checker_dissolve_bmesh`` on every object, seeded by its selected edges.
+
+    ``seeds`` optionally maps object names to a ``SeedSnapshot``. Returns
+    the number of objects that had seeds.
+    """
+    processed = 0
+    for obj in objects:
+        bm = bmesh.from_edit_mesh(obj.data)
+        if seeds is not None:
+            snapshot = seeds.get(obj.name)
+            seed_edges = snapshot.elements(bm) if snapshot else []
+        else:
+            seed_edges = [e for e in bm.edges if e.select]
+        if not seed_edges:
+            continue
+        checker_dissolve_bmesh(bm, seed_edges, skip, nth, offset, use_ring)
+        bmesh.update_edit_mesh(obj.data)
+        processed += 1
+    return processed
 
 
 class MESH_OT_checker_dissolve(Operator):
@@ -30,8 +109,7 @@ class MESH_OT_checker_dissolve(Operator):
         default=False
     )
 
-    _seed_edge_indices: list[int] | None = None
-    _seed_edge_keys: list[tuple[int, int]] | None = None  # (v0_idx, v1_idx) per edge
+    _seeds: dict[str, SeedSnapshot] | None = None
 
     @classmethod
     def poll(cls, context):
@@ -39,60 +117,12 @@ class MESH_OT_checker_dissolve(Operator):
         return obj and obj.type == 'MESH' and context.mode == 'EDIT_MESH'
 
     def _capture_seed(self, context):
-        bm, _ = _bm_from_context(context)
-        if not bm:
-            return False
-        bm.edges.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
-
-        sel_edges = [e for e in bm.edges if e.select]
-        if not sel_edges:
-            return False
-
-        self._seed_edge_indices = [e.index for e in sel_edges]
-        self._seed_edge_keys = [tuple(sorted((e.verts[0].index, e.verts[1].index))) for e in sel_edges]
-        return True
-
-    def _restore_seed(self, context):
-        """Restore original seed selection. Prefer indices; fall back to edge keys."""
-        bm, me = _bm_from_context(context)
-        if not bm:
-            return False
-
-        bm.edges.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
-
-        for e in bm.edges:
-            e.select_set(False)
-
-        restored = 0
-
-        # Try indices
-        if self._seed_edge_indices:
-            for idx in self._seed_edge_indices:
-                if 0 <= idx < len(bm.edges):
-                    try:
-                        bm.edges[idx].select_set(True)
-                        restored += 1
-                    except IndexError:
-                        bm.edges.ensure_lookup_table()
-
-        # Fallback to keys
-        if restored == 0 and self._seed_edge_keys:
-            for a, b in self._seed_edge_keys:
-                if 0 <= a < len(bm.verts) and 0 <= b < len(bm.verts):
-                    va = bm.verts[a]
-                    vb = bm.verts[b]
-                    # find an edge va-vb
-                    for e in va.link_edges:
-                        v0, v1 = e.verts
-                        if (v0 == va and v1 == vb) or (v0 == vb and v1 == va):
-                            e.select_set(True)
-                            restored += 1
-                            break
-
-        bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
-        return restored > 0
+        self._seeds = {}
+        for obj in edit_mesh_objects(context):
+            snapshot = SeedSnapshot(bmesh.from_edit_mesh(obj.data), 'EDGE')
+            if len(snapshot):
+                self._seeds[obj.name] = snapshot
+        return bool(self._seeds)
 
     def invoke(self, context, event):
         if not context.tool_settings.mesh_select_mode[1]:
@@ -108,24 +138,20 @@ class MESH_OT_checker_dissolve(Operator):
             self.report({'WARNING'}, "Switch to Edge Select mode first.")
             return {'CANCELLED'}
 
-        if not self._restore_seed(context):
+        if not self._seeds:
             self.report({'WARNING'}, "Could not restore original selection. Re-select an edge and run again.")
             return {'CANCELLED'}
 
-        # === sequence ===
-        # (optional) 1) ring from seed
-        if not self.only_selected:
-            bpy.ops.mesh.loop_multi_select(ring=True)
-
-        # 2) checker deselect with our redo-able props
-        bpy.ops.mesh.select_nth(skip=self.deselected, nth=self.selected, offset=self.offset)
-
-        # 3) loop select (perpendicular)
-        bpy.ops.mesh.loop_multi_select(ring=False)
-
-        # 4) dissolve edges — with verts (matches regular dissolve)
-        bpy.ops.mesh.dissolve_edges(use_verts=True, use_face_split=False)
+        processed = checker_dissolve_objects(
+            edit_mesh_objects(context),
+            skip=self.deselected,
+            nth=self.selected,
+            offset=self.offset,
+            use_ring=not self.only_selected,
+            seeds=self._seeds,
+        )
+        if not processed:
+            self.report({'WARNING'}, "Could not restore original selection. Re-select an edge and run again.")
+            return {'CANCELLED'}
 
         return {'FINISHED'}
-
-
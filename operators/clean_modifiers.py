@@ -1,30 +1,10 @@
 import bpy
 from bpy.types import Operator
+from .modifier_audit import modifier_issue, audit_object, invalidate, audit_targets
 
 def is_modifier_useless(mod):
-    # 1. Check for missing target objects (Broken modifiers)
-    target_props = ['object', 'target', 'map_object', 'vertex_group_object', 'control_object']
-    for prop in target_props:
-        if hasattr(mod, prop):
-            val = getattr(mod, prop)
-            if val is None:
-                # Specific types that absolutely need a target to function
-                if mod.type in {
-                    'BOOLEAN', 'SHRINKWRAP', 'ARMATURE', 'HOOK', 
-                    'DATA_TRANSFER', 'MESH_DEFORM', 'LATTICE', 
-                    'SURFACE_DEFORM', 'WARP', 'CURVE', 'CAST'
-                }:
-                    return True
-                if mod.type == 'MIRROR' and prop == 'mirror_object' and val is None:
-                    pass
-    # 2. Check for zeroed out influence/levels (Useless modifiers)
-    if mod.type == 'SUBSURF' and mod.levels == 0 and mod.render_levels == 0:
-        return True
-    if mod.type == 'BEVEL' and mod.width == 0.0:
-        return True
-    if mod.type == 'SOLIDIFY' and mod.thickness == 0.0:
-        return True
-    return False
+    # Broken (missing target) or zeroed out influence/levels
+    return modifier_issue(mod) is not None
 
 
 class REXTOOLS3_OT_CleanModifiers(Operator):
@@ -43,10 +23,7 @@ class REXTOOLS3_OT_CleanModifiers(Operator):
         orig_mode_ctx = context.mode
 
         # Determine target objects
-        if all_objs:
-            targets = [obj for obj in context.view_layer.objects if obj.visible_get() and obj.type == 'MESH']
-        else:
-            targets = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        targets = audit_targets(context, all_objs)
 
         if not targets:
             if not all_objs:
@@ -63,19 +40,18 @@ class REXTOOLS3_OT_CleanModifiers(Operator):
         obj_count = 0
 
         for obj in targets:
-            to_remove = []
-            for mod in obj.modifiers:
-                if settings.clean_modifiers_hidden and not mod.show_viewport:
-                    to_remove.append(mod)
-                    continue
-                if is_modifier_useless(mod):
-                    to_remove.append(mod)
+            # fresh report: names from the panel cache may be stale
+            report = audit_object(obj)
+            to_remove = set(report["broken"]) | set(report["zero"])
+            if settings.clean_modifiers_hidden:
+                to_remove.update(report["hidden"])
             
             if to_remove:
                 obj_count += 1
-                for mod in to_remove:
-                    obj.modifiers.remove(mod)
+                for name in to_remove:
+                    obj.modifiers.remove(obj.modifiers[name])
                     removed_count += 1
+                invalidate(obj)
 
         # Restore mode
         try:
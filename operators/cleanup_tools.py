@@ -1,6 +1,110 @@
 import bpy
+import bmesh
+import numpy as np
 from bpy.types import Operator
 from ..core import notify
+from .uv_utils import unique_meshes
+
+# Same thresholds the Tris to Quads operator is run with (70 degrees)
+QUAD_FACE_THRESHOLD = 1.22173
+QUAD_SHAPE_THRESHOLD = 1.22173
+
+
+def clear_custom_normals(context, obj):
+    """Drop the custom split normals of ``obj``'s mesh. Returns True if there were any."""
+    mesh = obj.data
+    if not mesh.has_custom_normals:
+        return False
+    attr = mesh.attributes.get("custom_normal")
+    if attr is not None:
+        # Blender 4.5+ stores them as a generic attribute
+        mesh.attributes.remove(attr)
+        mesh.update()
+    else:
+        # Older versions keep a custom data layer that only the operator removes
+        # (setting zero normals leaves the layer, so has_custom_normals stays True)
+        with context.temp_override(object=obj, active_object=obj, selected_objects=[obj]):
+            bpy.ops.mesh.customdata_custom_splitnormals_clear()
+    return True
+
+
+def join_triangles(mesh):
+    """Tris to quads on the whole mesh through an object-mode BMesh."""
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.join_triangles(
+        bm,
+        faces=bm.faces[:],
+        angle_face_threshold=QUAD_FACE_THRESHOLD,
+        angle_shape_threshold=QUAD_SHAPE_THRESHOLD,
+        cmp_uvs=True,
+        cmp_seam=True,
+        cmp_sharp=True,
+        cmp_materials=True,
+    )
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+
+def mesh_users(meshes):
+    """Objects using each of ``meshes`` (all of bpy.data, not just the selection),
+    keyed by mesh name."""
+    names = {mesh.name_full for mesh in meshes}
+    users = {name: [] for name in names}
+    for obj in bpy.data.objects:
+        if obj.type == 'MESH' and obj.data.name_full in names:
+            users[obj.data.name_full].append(obj)
+    return users
+
+
+def remove_unused_material_slots(mesh, users=()):
+    """Drop slots no face uses and remap face indices in one bulk write.
+
+    ``users`` are the objects sharing ``mesh``; their object-linked materials
+    stay on the slot they belonged to. Returns the number of slots removed.
+    """
+    count = len(mesh.materials)
+    if not count:
+        return 0
+    indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", indices)
+    # out-of-range indices render with the last slot
+    np.clip(indices, 0, count - 1, out=indices)
+
+    used = np.zeros(count, dtype=bool)
+    used[np.unique(indices)] = True
+    if used.all():
+        return 0
+    kept = np.flatnonzero(used)
+    remap = (np.cumsum(used) - 1).astype(np.int32)
+
+    links = [(obj, [(slot.link, slot.material) for slot in obj.material_slots]) for obj in users]
+    materials = [mesh.materials[i] for i in kept]
+
+    # clear() resets the face indices and the users' slots, both are rewritten below
+    mesh.materials.clear()
+    for mat in materials:
+        mesh.materials.append(mat)
+    mesh.polygons.foreach_set("material_index", remap[indices])
+
+    for obj, slots in links:
+        for new_index, old_index in enumerate(kept):
+            link, mat = slots[old_index]
+            if link == 'OBJECT':
+                slot = obj.material_slots[new_index]
+                slot.link = 'OBJECT'
+                slot.material = mat
+    mesh.update()
+    return count - len(kept)
+
+
+def remove_unused_slots_bulk(meshes):
+    """Unused-slot removal over many meshes, each shared mesh once.
+    Returns the total number of slots removed."""
+    users = mesh_users(meshes)
+    return sum(remove_unused_material_slots(mesh, users[mesh.name_full]) for mesh in meshes)
+
 
 class REXTOOLS3_OT_CleanObjects(Operator):
     """Clean up selected objects based on toggled settings"""
@@ -20,51 +124,33 @@ class REXTOOLS3_OT_CleanObjects(Operator):
             notify.warning("No mesh objects selected")
             return {'CANCELLED'}
 
-        active_obj = context.active_object
-
+        # Everything works on mesh data, shared meshes are cleaned once
+        meshes = [me for me in unique_meshes(selected_objects) if not me.library]
+        owners = {}
         for obj in selected_objects:
+            owners.setdefault(obj.data.name_full, obj)
+        normals = slots = 0
+
+        for mesh in meshes:
             # 1. Normals
-            if props.normals:
-                context.view_layer.objects.active = obj
-                bpy.ops.mesh.customdata_custom_splitnormals_clear()
+            if props.normals and clear_custom_normals(context, owners[mesh.name_full]):
+                normals += 1
 
             # 2. Quad
             if props.quad:
-                context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-                # Ensure we select everything in edit mode
-                bpy.ops.mesh.select_all(action='SELECT')
-                
-                # Use the correct API for modern Blender with requested defaults
-                try:
-                    bpy.ops.mesh.tris_convert_to_quads(
-                        face_threshold=1.22173, 
-                        shape_threshold=1.22173, 
-                        uvs=True, 
-                        seam=True, 
-                        sharp=True, 
-                        materials=True
-                    )
-                except AttributeError:
-                    # Fallback for older versions if necessary
-                    if hasattr(bpy.ops.mesh, "tris_to_quads"):
-                        bpy.ops.mesh.tris_to_quads()
-                        
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-            # 3. Mats
-            if props.mats:
-                context.view_layer.objects.active = obj
-                
-                # Standard Blender: Remove unused material slots
-                try:
-                    bpy.ops.object.material_slot_remove_unused()
-                except Exception as e:
-                    print(f"Error removing unused material slots for {obj.name}: {e}")
-
-        # Restore active object
-        if active_obj in context.view_layer.objects.values():
-            context.view_layer.objects.active = active_obj
+                join_triangles(mesh)
+
+        # 3. Mats
+        if props.mats:
+            slots = remove_unused_slots_bulk(meshes)
+
+        print("\n--- RexTools3 Clean Objects Summary ---")
+        print(f"Meshes: {len(meshes)} (from {len(selected_objects)} objects)")
+        if props.normals:
+            print(f"Custom normals cleared: {normals}")
+        if props.mats:
+            print(f"Unused material slots removed: {slots}")
+        print("--------------------------------\n")
 
         notify.success(f"Cleaned {len(selected_objects)} objects")
         return {'FINISHED'}
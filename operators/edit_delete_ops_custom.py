@@ -1,5 +1,7 @@
 import bpy
 from bpy.types import Operator
+from .checker_dissolve import checker_dissolve_objects
+from .mesh_utils import edit_mesh_objects
 
 class REXTOOLS3_OT_delete_linked_ex(Operator):
     bl_idname = "rextools3.delete_linked_ex"
@@ -18,10 +20,7 @@ class REXTOOLS3_OT_checker_dissolve(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        bpy.ops.mesh.loop_multi_select(ring=True)
-        bpy.ops.mesh.select_nth(nth=1)
-        bpy.ops.mesh.loop_multi_select(ring=False)
-        bpy.ops.mesh.dissolve_edges()
+        checker_dissolve_objects(edit_mesh_objects(context), skip=1, nth=1, use_ring=True)
         return {'FINISHED'}
 
 
@@ -31,10 +30,7 @@ class REXTOOLS3_OT_checker_dissolve_selected(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-       
-        bpy.ops.mesh.select_nth(skip=1)
-        bpy.ops.mesh.loop_multi_select(ring=False)
-        bpy.ops.mesh.dissolve_edges()
+        checker_dissolve_objects(edit_mesh_objects(context), skip=1, nth=1, use_ring=False)
         return {'FINISHED'}
 
 
@@ -1,33 +1,48 @@
 import bpy
+import bmesh
+import numpy as np
+from .uv_utils import island_boundary_edges, read_edge_seams, write_edge_seams, visible_selected_meshes
+
 
 class REX_OT_mark_seams_from_islands(bpy.types.Operator):
     bl_idname = "rextools3.mark_seams_from_islands"
     bl_label = "Mark Seams from Islands"
     bl_description = "Mark seams around UV island borders (from Edit Mesh mode)"
+    bl_options = {'REGISTER', 'UNDO'}
 
-    
-    def execute(self, context):
-        area = context.area
-        orig_type = area.type
-        
+    @classmethod
+    def poll(cls, context):
+        return any(o.type == 'MESH' for o in context.objects_in_mode or context.selected_objects)
 
-          # 1) switch this area to IMAGE_EDITOR so we can reach uv_editor
-        orig_type = area.type
-        try:
-            area.type = 'IMAGE_EDITOR'
-            space = area.spaces.active
-            uv = space.uv_editor
-            bpy.context.area.ui_type = 'UV'
-            
-            bpy.ops.uv.select_all(action='SELECT')
-            bpy.ops.uv.seams_from_islands()
-            bpy.ops.uv.select_all(action='DESELECT')
+    def execute(self, context):
+        # Island borders are computed from the loop UV arrays, no UV editor needed
+        if context.mode == 'EDIT_MESH':
+            objects = [o for o in context.objects_in_mode_unique_data if o.type == 'MESH']
+        else:
+            objects = list({o.data.name_full: o for o in visible_selected_meshes(context)}.values())
 
-        finally:
-            # 2) restore original area type
-            area.type = orig_type
+        marked = 0
+        for obj in objects:
+            mesh = obj.data
+            if obj.mode == 'EDIT':
+                # read the edit-mesh state, write only the new seams back through BMesh
+                obj.update_from_editmode()
+                new_seams = np.flatnonzero(island_boundary_edges(mesh) & ~read_edge_seams(mesh))
+                if not len(new_seams):
+                    continue
+                bm = bmesh.from_edit_mesh(mesh)
+                bm.edges.ensure_lookup_table()
+                for idx in new_seams:
+                    bm.edges[idx].seam = True
+                bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+                marked += len(new_seams)
+            else:
+                seams = read_edge_seams(mesh)
+                new_seams = island_boundary_edges(mesh) & ~seams
+                if not new_seams.any():
+                    continue
+                write_edge_seams(mesh, seams | new_seams)
+                marked += int(np.count_nonzero(new_seams))
 
-        self.report({'INFO'}, "Seams marked from UV islands")
+        self.report({'INFO'}, f"Seams marked from UV islands ({marked} edges)")
         return {'FINISHED'}
-
-
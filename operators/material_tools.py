@@ -1,7 +1,30 @@
 import bpy
 from bpy.types import Operator
+from bpy.props import EnumProperty
 from ..core import notify
 
+
+def set_mesh_materials(mesh, materials):
+    """Make the slots of ``mesh`` exactly ``materials``. Returns False if they already were."""
+    if mesh.materials[:] == materials:
+        return False
+    mesh.materials.clear()
+    for mat in materials:
+        mesh.materials.append(mat)
+    return True
+
+
+def set_object_materials(objects, mesh, materials):
+    """Assign ``materials`` as object-linked slots on ``objects``, leaving the
+    shared mesh's own materials alone. Only grows the slot count if needed."""
+    for _ in range(len(materials) - len(mesh.materials)):
+        mesh.materials.append(None)
+    for obj in objects:
+        for i, slot in enumerate(obj.material_slots):
+            slot.link = 'OBJECT'
+            slot.material = materials[i] if i < len(materials) else None
+
+
 class REXTOOLS3_OT_ReplaceMaterials(Operator):
     """Replace materials of all selected objects with the materials from the active object"""
     bl_idname = "rextools3.replace_materials"
@@ -9,6 +32,16 @@ class REXTOOLS3_OT_ReplaceMaterials(Operator):
     bl_description = "Assign active object's material slots to all selected objects"
     bl_options = {'REGISTER', 'UNDO'}
 
+    link: EnumProperty(
+        name="Link",
+        items=[
+            ('AUTO', "Auto", "Object links for meshes also used by unselected objects, mesh data otherwise"),
+            ('DATA', "Data", "Rewrite the mesh materials (affects every user of the mesh)"),
+            ('OBJECT', "Object", "Link the materials to the objects, meshes keep theirs"),
+        ],
+        default='AUTO'
+    )
+
     @classmethod
     def poll(cls, context):
         return (context.active_object is not None and 
@@ -25,13 +58,25 @@ class REXTOOLS3_OT_ReplaceMaterials(Operator):
             notify.warning("No other mesh objects selected")
             return {'CANCELLED'}
 
+        # Group by mesh so shared data is rewritten once
+        groups = {}
         for obj in selected_meshes:
-            # Clear existing slots
-            obj.data.materials.clear()
-            
-            # Append new slots in order
-            for mat in target_materials:
-                obj.data.materials.append(mat)
-        
-        notify.success(f"Replaced materials on {len(selected_meshes)} objects")
+            if obj.data != active_obj.data:
+                groups.setdefault(obj.data.name_full, (obj.data, []))[1].append(obj)
+
+        touched = 0
+        linked = 0
+        for mesh, objects in groups.values():
+            use_objects = self.link == 'OBJECT' or (self.link == 'AUTO' and mesh.users > len(objects))
+            if use_objects:
+                set_object_materials(objects, mesh, target_materials)
+                linked += len(objects)
+                touched += 1
+            elif set_mesh_materials(mesh, target_materials):
+                touched += 1
+
+        msg = f"Replaced materials on {len(selected_meshes)} objects ({touched} unique meshes touched"
+        if linked:
+            msg += f", {linked} objects via object links"
+        notify.success(msg + ")")
         return {'FINISHED'}
@@ -32,37 +32,44 @@ class MESH_OT_angle_loop_select(bpy.types.Operator):
     )
 
     def execute(self, context):
-        from .mesh_utils import crawl
-        obj = context.active_object
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "Active object is not a mesh")
+        from .mesh_utils import crawl, edit_mesh_objects
+        objects = edit_mesh_objects(context)
+        if not objects:
+            self.report({'ERROR'}, "No mesh in Edit Mode")
             return {'CANCELLED'}
-        
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.edges.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
 
-        selected_seeds = [e for e in bm.edges if e.select]
-        if not selected_seeds:
-            self.report({'WARNING'}, "No edge selected to start crawling")
-            return {'CANCELLED'}
-
-        edges_to_select = set(selected_seeds)
-        
         angle_tol = math.radians(self.angle_threshold)
         straight_tol = math.radians(self.straightness_threshold)
-        
-        for start_edge in selected_seeds:
-            try:
-                ref_angle = start_edge.calc_face_angle()
-            except ValueError:
-                ref_angle = 0.0
 
-            for start_vert in start_edge.verts:
-                crawl(start_edge, start_vert, ref_angle, edges_to_select, angle_tol, straight_tol, False, self.max_steps)
+        # every object in edit mode, one operator call / one undo step
+        crawled = 0
+        for obj in objects:
+            bm = bmesh.from_edit_mesh(obj.data)
+            bm.edges.ensure_lookup_table()
+            bm.verts.ensure_lookup_table()
+
+            selected_seeds = [e for e in bm.edges if e.select]
+            if not selected_seeds:
+                continue
+
+            edges_to_select = set(selected_seeds)
 
-        for e in edges_to_select:
-            e.select = True
+            for start_edge in selected_seeds:
+                try:
+                    ref_angle = start_edge.calc_face_angle()
+                except ValueError:
+                    ref_angle = 0.0
 
-        bmesh.update_edit_mesh(obj.data)
+                for start_vert in start_edge.verts:
+                    crawl(start_edge, start_vert, ref_angle, edges_to_select, angle_tol, straight_tol, False, self.max_steps)
+
+            for e in edges_to_select:
+                e.select = True
+
+            bmesh.update_edit_mesh(obj.data)
+            crawled += 1
+
+        if not crawled:
+            self.report({'WARNING'}, "No edge selected to start crawling")
+            return {'CANCELLED'}
         return {'FINISHED'}
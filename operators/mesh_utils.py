@@ -1,5 +1,14 @@
 import bmesh
 import math
+import heapq
+import bisect
+import numpy as np
+
+def edit_mesh_objects(context):
+    """Mesh objects in edit mode, one per mesh datablock."""
+    if context.mode != 'EDIT_MESH':
+        return []
+    return [o for o in context.objects_in_mode_unique_data if o.type == 'MESH']
 
 def find_next_edge(curr_edge, curr_vert, ref_angle, visited_edges, angle_tol, straight_tol, stop_at_seam):
     # 1. Check if we should stop here because of existing seams at this vertex
@@ -66,3 +75,257 @@ def crawl(start_edge, start_vert, ref_angle, visited_edges, angle_tol, straight_
         # update curr_vert to the other end of next_edge
         curr_vert = next_edge.other_vert(curr_vert)
         curr_edge = next_edge
+
+
+class AngleFloodFill:
+    """Face flood fill bounded by the dihedral angle between neighbours.
+
+    The face adjacency graph and per-edge angles are built once. Faces are
+    then claimed smallest-angle-first (Prim style) and each one records the
+    largest angle crossed on its way from the seeds, so the region for any
+    threshold is a prefix of ``order``. Raising the threshold resumes the
+    fill, lowering it just truncates the prefix.
+    """
+
+    def __init__(self, bm, seed_indices):
+        bm.faces.ensure_lookup_table()
+        self.faces = bm.faces
+        self.adjacency = [[] for _ in range(len(bm.faces))]
+
+        for edge in bm.edges:
+            link = [f for f in edge.link_faces if not f.hide]
+            if len(link) < 2:
+                continue
+            if len(link) == 2:
+                angle = edge.calc_face_angle(0.0)
+                self.adjacency[link[0].index].append((angle, link[1].index))
+                self.adjacency[link[1].index].append((angle, link[0].index))
+                continue
+            # Non-manifold edge: connect every face pair sharing it
+            for i, fa in enumerate(link):
+                for fb in link[i + 1:]:
+                    angle = fa.normal.angle(fb.normal, 0.0)
+                    self.adjacency[fa.index].append((angle, fb.index))
+                    self.adjacency[fb.index].append((angle, fa.index))
+
+        self.visited = bytearray(len(bm.faces))
+        self.order = []
+        self.levels = []
+        self.heap = []
+        for idx in seed_indices:
+            self._claim(int(idx), 0.0)
+        self.seed_count = len(self.order)
+
+    def _claim(self, idx, level):
+        if self.visited[idx]:
+            return
+        self.visited[idx] = 1
+        self.order.append(idx)
+        self.levels.append(level)
+        for angle, other in self.adjacency[idx]:
+            if not self.visited[other]:
+                heapq.heappush(self.heap, (angle, other))
+
+    def grow(self, threshold):
+        heap = self.heap
+        while heap and heap[0][0] <= threshold:
+            angle, idx = heapq.heappop(heap)
+            if self.visited[idx]:
+                continue
+            self._claim(idx, max(angle, self.levels[-1]))
+
+    def count(self, threshold):
+        """Grow as needed and return how many faces of ``order`` are in range."""
+        self.grow(threshold)
+        return bisect.bisect_right(self.levels, threshold)
+
+
+def _vert_key(elem):
+    if isinstance(elem, bmesh.types.BMVert):
+        return (elem.index,)
+    return tuple(sorted(v.index for v in elem.verts))
+
+
+class SeedSnapshot:
+    """Compact copy of a BMesh selection (one domain) that restores cheaply.
+
+    Stores the selected element indices as a NumPy array, the vertex keys of
+    those elements and a topology hash. ``restore`` checks the hash against
+    the stored indices only, so repeated restores in modal and redo loops
+    cost O(selection). If topology changed it falls back to vertex keys.
+    """
+
+    def __init__(self, bm, domain='FACE'):
+        self.domain = domain
+        bm.verts.index_update()
+        seq = self._seq(bm)
+        seq.index_update()
+        seq.ensure_lookup_table()
+        self.indices = np.fromiter((e.index for e in seq if e.select), dtype=np.int32)
+        self.keys = [_vert_key(seq[i]) for i in self.indices]
+        self.topology = self._topology_hash(bm, self.keys)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def _seq(self, bm):
+        if self.domain == 'VERT':
+            return bm.verts
+        if self.domain == 'EDGE':
+            return bm.edges
+        return bm.faces
+
+    @staticmethod
+    def _topology_hash(bm, keys):
+        return hash((len(bm.verts), len(bm.edges), len(bm.faces), tuple(keys)))
+
+    def matches(self, bm):
+        """True if the stored indices still point at the same elements."""
+        seq = self._seq(bm)
+        seq.ensure_lookup_table()
+        if len(self.indices) and int(self.indices.max()) >= len(seq):
+            return False
+        keys = [_vert_key(seq[i]) for i in self.indices]
+        return self._topology_hash(bm, keys) == self.topology
+
+    def elements(self, bm):
+        """Resolve the snapshot to live elements of ``bm``."""
+        seq = self._seq(bm)
+        if self.matches(bm):
+            return [seq[i] for i in self.indices]
+
+        # Topology changed: find each element again by its vertex key
+        bm.verts.ensure_lookup_table()
+        found = []
+        for key in self.keys:
+            if key[-1] >= len(bm.verts):
+                continue
+            v = bm.verts[key[0]]
+            if self.domain == 'VERT':
+                found.append(v)
+                continue
+            candidates = v.link_edges if self.domain == 'EDGE' else v.link_faces
+            for elem in candidates:
+                if _vert_key(elem) == key:
+                    found.append(elem)
+                    break
+        return found
+
+    def restore(self, bm):
+        """Select the snapshot elements. Returns how many were restored.
+
+        Does not deselect anything else; deselect the previous pass first
+        (``deselect_faces``) when a clean restore is needed.
+        """
+        elems = self.elements(bm)
+        for elem in elems:
+            elem.select_set(True)
+        return len(elems)
+
+
+def selected_face_indices(bm):
+    """Indices of the selected faces of ``bm``."""
+    return [f.index for f in bm.faces if f.select]
+
+
+def deselect_faces(bm, indices):
+    """Deselect the faces at ``indices`` (with their edges and verts) and
+    leave the rest of the selection alone."""
+    bm.faces.ensure_lookup_table()
+    faces = bm.faces
+    for idx in indices:
+        faces[idx].select_set(False)
+
+
+def walk_edge_ring(start_edge):
+    """Edges of the quad ring through ``start_edge`` (both directions).
+
+    Stops at non-quads, boundaries and non-manifold edges; a closed ring
+    ends when it meets an edge it already visited.
+    """
+    ring = [start_edge]
+    seen = {start_edge}
+    for loop in start_edge.link_loops[:2]:
+        while len(loop.face.verts) == 4:
+            opposite = loop.link_loop_next.link_loop_next
+            edge = opposite.edge
+            if edge in seen:
+                break
+            seen.add(edge)
+            ring.append(edge)
+            if len(edge.link_loops) != 2:
+                break
+            loop = opposite.link_loop_radial_next
+    return ring
+
+
+def next_loop_edge(edge, vert):
+    """Edge continuing the loop of ``edge`` across ``vert``, or None at poles."""
+    if len(vert.link_edges) != 4:
+        return None
+    faces = set(edge.link_faces)
+    candidates = [
+        e for e in vert.link_edges
+        if e != edge and not faces.intersection(e.link_faces)
+    ]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def walk_edge_loop(start_edge, stop=None):
+    """Edges of the edge loop through ``start_edge`` and whether it is closed.
+
+    Walks both directions through valence-4 verts with no step cap, so the
+    cost is the loop length. ``stop(edge, vert, nxt)`` can end a direction
+    early when stepping from ``edge`` across ``vert`` onto ``nxt`` (``nxt``
+    is not included).
+    """
+    edges = [start_edge]
+    seen = {start_edge}
+    for vert in start_edge.verts:
+        edge = start_edge
+        while True:
+            nxt = next_loop_edge(edge, vert)
+            if nxt is None:
+                break
+            if nxt == start_edge:
+                return edges, True
+            if nxt in seen:
+                break
+            if stop is not None and stop(edge, vert, nxt):
+                break
+            seen.add(nxt)
+            edges.append(nxt)
+            vert = nxt.other_vert(vert)
+            edge = nxt
+    return edges, False
+
+
+def region_border_edges(faces):
+    """Border edges of a face region (what region_to_loop selects), O(region)."""
+    region = set(faces)
+    border = set()
+    for f in region:
+        for e in f.edges:
+            if sum(1 for lf in e.link_faces if lf in region) == 1:
+                border.add(e)
+    return border
+
+
+def seam_islands(seed_faces):
+    """All faces of the seam-delimited islands that contain ``seed_faces``."""
+    island = set()
+    stack = []
+    for f in seed_faces:
+        if f not in island and not f.hide:
+            island.add(f)
+            stack.append(f)
+    while stack:
+        f = stack.pop()
+        for e in f.edges:
+            if e.seam:
+                continue
+            for lf in e.link_faces:
+                if lf not in island and not lf.hide:
+                    island.add(lf)
+                    stack.append(lf)
+    return island
@@ -0,0 +1,60 @@
+import time
+
+
+class ThrottledModalMixin:
+    """Coalesce modal input into timer-driven recomputes.
+
+    Mix into a modal ``Operator`` and implement ``_recompute(context)``.
+    Input handlers only call ``_request_recompute``; the actual work runs on
+    the next TIMER tick, so a burst of MOUSEMOVE events costs one recompute.
+    Each recompute's wall time is kept in ``recompute_times`` (ms).
+
+    Not an ``Operator`` subclass on purpose, auto_load would register it.
+    """
+
+    # seconds between recomputes (~30 per second)
+    recompute_interval = 1.0 / 30.0
+
+    def _throttle_start(self, context):
+        self._dirty = False
+        self.recompute_times = []
+        self._timer = context.window_manager.event_timer_add(
+            self.recompute_interval, window=context.window
+        )
+
+    def _throttle_stop(self, context):
+        if getattr(self, "_timer", None) is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+    def _request_recompute(self, context):
+        self._dirty = True
+
+    def _throttle_flush(self, context):
+        """Run the pending recompute now, e.g. right before confirming."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        start = time.perf_counter()
+        self._recompute(context)
+        self.recompute_times.append((time.perf_counter() - start) * 1000.0)
+        if context.area:
+            context.area.tag_redraw()
+
+    def _throttle_tick(self, context, event):
+        """Returns True if the event was our timer (consumed)."""
+        if event.type != 'TIMER':
+            return False
+        self._throttle_flush(context)
+        return True
+
+    def latency_summary(self):
+        times = self.recompute_times
+        if not times:
+            return "-"
+        return f"{sum(times) / len(times):.1f} avg / {max(times):.1f} max ms"
+
+    def _report_latency(self):
+        times = self.recompute_times
+        if times:
+            self.report({'INFO'}, f"{len(times)} recomputes, {self.latency_summary()}")
@@ -0,0 +1,176 @@
+import bpy
+from bpy.types import Operator
+from bpy.app.handlers import persistent
+
+# Pointer properties a modifier can hold its target in
+TARGET_PROPS = ('object', 'target', 'map_object', 'vertex_group_object', 'control_object')
+
+# Specific types that absolutely need a target to function
+NEEDS_TARGET = {
+    'BOOLEAN', 'SHRINKWRAP', 'ARMATURE', 'HOOK',
+    'DATA_TRANSFER', 'MESH_DEFORM', 'LATTICE',
+    'SURFACE_DEFORM', 'WARP', 'CURVE', 'CAST'
+}
+
+# Zeroed out influence/levels
+ZERO_EFFECT = {
+    'SUBSURF': lambda mod: mod.levels == 0 and mod.render_levels == 0,
+    'BEVEL': lambda mod: mod.width == 0.0,
+    'SOLIDIFY': lambda mod: mod.thickness == 0.0,
+}
+
+# Max modifiers listed in the panel report
+PANEL_ROWS = 8
+
+_target_rules = {}  # modifier type -> target properties to check (built on first sight)
+_cache = {}         # object name -> (modifier stack key, audit report)
+
+
+def _target_props(mod):
+    props = _target_rules.get(mod.type)
+    if props is None:
+        if mod.type in NEEDS_TARGET:
+            rna = mod.bl_rna.properties
+            props = tuple(p for p in TARGET_PROPS if p in rna)
+        else:
+            props = ()
+        _target_rules[mod.type] = props
+    return props
+
+
+def modifier_issue(mod):
+    """'BROKEN' (missing target), 'ZERO' (no effect) or None."""
+    for prop in _target_props(mod):
+        if getattr(mod, prop) is None:
+            return 'BROKEN'
+    check = ZERO_EFFECT.get(mod.type)
+    if check is not None and check(mod):
+        return 'ZERO'
+    return None
+
+
+def audit_object(obj):
+    """Names of broken, zero-effect and viewport-hidden modifiers on ``obj``.
+    A hidden modifier can also be broken or zero-effect."""
+    report = {"broken": [], "zero": [], "hidden": []}
+    for mod in obj.modifiers:
+        issue = modifier_issue(mod)
+        if issue == 'BROKEN':
+            report["broken"].append(mod.name)
+        elif issue == 'ZERO':
+            report["zero"].append(mod.name)
+        if not mod.show_viewport:
+            report["hidden"].append(mod.name)
+    return report
+
+
+def _stack_key(obj):
+    return tuple((mod.name, mod.type, mod.show_viewport) for mod in obj.modifiers)
+
+
+def get_audit(obj):
+    """Cached audit report of ``obj`` for drawing. Dropped when the object's
+    geometry is re-evaluated or its modifiers are renamed, added or removed.
+    Operators that act on the names should call ``audit_object`` instead."""
+    key = _stack_key(obj)
+    cached = _cache.get(obj.name_full)
+    if cached is None or cached[0] != key:
+        cached = _cache[obj.name_full] = (key, audit_object(obj))
+    return cached[1]
+
+
+def invalidate(obj):
+    _cache.pop(obj.name_full, None)
+
+
+def audit_totals(objects):
+    """Summed counts over ``objects`` plus (name, report) of the ones with issues."""
+    totals = {"broken": 0, "zero": 0, "hidden": 0}
+    flagged = []
+    for obj in objects:
+        report = audit_object(obj)
+        if report["broken"] or report["zero"] or report["hidden"]:
+            flagged.append((obj.name, report))
+            for key in totals:
+                totals[key] += len(report[key])
+    return totals, flagged
+
+
+def audit_targets(context, all_objects):
+    if all_objects:
+        return [obj for obj in context.view_layer.objects if obj.visible_get() and obj.type == 'MESH']
+    return [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+
+def draw_modifier_audit(layout, obj):
+    """Audit of the active object only; the full report is the Audit Modifiers operator."""
+    if obj is None or obj.type != 'MESH':
+        layout.label(text="No active mesh", icon='INFO')
+        return
+    report = get_audit(obj)
+    row = layout.row(align=True)
+    row.label(text=f"Broken: {len(report['broken'])}", icon='ERROR')
+    row.label(text=f"Zero: {len(report['zero'])}", icon='MODIFIER_OFF')
+    row.label(text=f"Hidden: {len(report['hidden'])}", icon='HIDE_ON')
+
+    col = layout.column(align=True)
+    for name in (report["broken"] + report["zero"])[:PANEL_ROWS]:
+        col.label(text=name, icon='MODIFIER')
+
+
+class REXTOOLS3_OT_AuditModifiers(Operator):
+    bl_idname = "rextools3.audit_modifiers"
+    bl_label = "Audit Modifiers"
+    bl_description = "List broken, zero-effect and hidden modifiers per object in the console"
+
+    def execute(self, context):
+        all_objs = context.scene.rex_common_settings.clean_modifiers_all
+        totals, flagged = audit_totals(audit_targets(context, all_objs))
+
+        # Detailed console output
+        print("\n--- RexTools3 Modifier Audit ---")
+        for name, report in flagged:
+            print(f"{name}:")
+            for key, label in (("broken", "Broken"), ("zero", "Zero effect"), ("hidden", "Hidden")):
+                if report[key]:
+                    print(f"  {label}: {', '.join(report[key])}")
+        print("--------------------------------\n")
+
+        self.report(
+            {'INFO'},
+            f"{len(flagged)} objects: {totals['broken']} broken, {totals['zero']} zero-effect, "
+            f"{totals['hidden']} hidden modifiers"
+        )
+        return {'FINISHED'}
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not _cache:
+        return
+    for update in depsgraph.updates:
+        data = update.id.original
+        # modifier edits re-evaluate the object's geometry
+        if isinstance(data, bpy.types.Object) and update.is_updated_geometry:
+            _cache.pop(data.name_full, None)
+
+
+@persistent
+def _on_load_post(*args):
+    _cache.clear()
+
+
+def register():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _cache.clear()
+    _target_rules.clear()
@@ -0,0 +1,102 @@
+# Low/high poly name suffixes, matched with precompiled anchored patterns.
+#
+# Plain Python (no bpy), so the benchmark runs outside Blender:
+#
+#   python operators/name_matcher.py [count]
+import re
+import random
+import time
+
+LOW_SUFFIXES = ["_low", "_lp", "_lowpoly", "low", "lp", "lowpoly", ".low", " low", "-low"]
+HIGH_SUFFIXES = ["_high", "_hp", "_highpoly", "high", "hp", "highpoly", ".high", " high", "-high"]
+
+
+def _alternation(suffixes):
+    # reversed, longest first so "_lowpoly" wins over "low" at the same position
+    return "|".join(re.escape(s[::-1]) for s in sorted(suffixes, key=len, reverse=True))
+
+
+_LOW = _alternation(LOW_SUFFIXES)
+_HIGH = _alternation(HIGH_SUFFIXES)
+
+# Both patterns run on the reversed name, so a suffix test is an anchored
+# match at position 0 instead of a search for the end of the string.
+# Kind of the suffix the name ends with, behind any .001 style counters
+# (a duplicate of "Crate_low" is still a low)
+SUFFIX_PATTERN = re.compile(rf"(?:\d{{3,}}\.)*(?:(?P<low>{_LOW})|(?P<high>{_HIGH}))", re.IGNORECASE)
+# Every trailing suffix and .001 style counter, in any order
+STRIP_PATTERN = re.compile(rf"(?:\d{{3,}}\.|{_LOW}|{_HIGH})+", re.IGNORECASE)
+
+
+def suffix_kind(name):
+    """-1 if ``name`` ends with a low suffix, 1 for a high suffix, else 0.
+    Trailing .001 style counters are skipped, like in ``clean_base_name``."""
+    match = SUFFIX_PATTERN.match(name[::-1])
+    if match is None:
+        return 0
+    return -1 if match.lastgroup == "low" else 1
+
+
+def clean_base_name(name):
+    """``name`` without its trailing low/high suffixes and .001 counters."""
+    match = STRIP_PATTERN.match(name[::-1])
+    if match is None:
+        return name
+    return name[:len(name) - match.end()]
+
+
+def _linear_kind(name):
+    n = re.sub(r'(?:\.\d{3,})+$', '', name.lower())
+    if any(n.endswith(s) for s in LOW_SUFFIXES):
+        return -1
+    if any(n.endswith(s) for s in HIGH_SUFFIXES):
+        return 1
+    return 0
+
+
+def _linear_clean(name):
+    # The per-suffix loop this module replaces, kept for the benchmark
+    name = re.sub(r'\.\d{3,}$', '', name)
+    for s in LOW_SUFFIXES + HIGH_SUFFIXES:
+        if name.lower().endswith(s):
+            return _linear_clean(name[:-len(s)])
+    return name
+
+
+def synthetic_names(count, seed=0):
+    rng = random.Random(seed)
+    stems = ["Crate", "Barrel", "Door_Frame", "Pipe", "Wall Panel", "Rock", "Helmet", "Cable-Run"]
+    suffixes = LOW_SUFFIXES + HIGH_SUFFIXES + ["", "", "_Mesh"]
+    names = []
+    for i in range(count):
+        name = f"{rng.choice(stems)}_{i % 997:03d}{rng.choice(suffixes)}"
+        if rng.random() < 0.3:
+            name += f".{rng.randint(1, 999):03d}"
+        names.append(name)
+    return names
+
+
+def benchmark(count=100_000):
+    """Time the compiled matcher against the linear suffix tests on ``count`` names."""
+    names = synthetic_names(count)
+    rows = []
+    for label, kind, clean in (
+        ("linear", _linear_kind, _linear_clean),
+        ("compiled", suffix_kind, clean_base_name),
+    ):
+        start = time.perf_counter()
+        for name in names:
+            kind(name)
+            clean(name)
+        rows.append((label, time.perf_counter() - start))
+
+    print(f"\n--- RexTools3 Name Matcher Benchmark ({count} names) ---")
+    for label, seconds in rows:
+        print(f"{label:>9}: {seconds * 1000:.0f} ms ({seconds / count * 1e6:.2f} us/name)")
+    print("--------------------------------\n")
+    return dict(rows)
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,4 +1,167 @@
 import bpy
+from bpy.props import BoolProperty, EnumProperty
+from .name_matcher import suffix_kind, clean_base_name
+
+
+def get_type_rating(obj):
+    """-2/2 for a low/high collection suffix, -1/1 for a low/high name suffix, else 0."""
+    # Check collections
+    for col in obj.users_collection:
+        kind = suffix_kind(col.name)
+        if kind:
+            return 2 * kind # Strongly low/high
+    
+    # Check names
+    return suffix_kind(obj.name) # Likely low/high
+
+
+def safe_rename(obj, target):
+    if obj.name == target:
+        return
+    
+    # If target name is taken by ANY other object
+    existing = bpy.data.objects.get(target)
+    if existing and existing != obj:
+        # Rename the conflicting object to free up the name
+        # We append .old and potentially another number if .old is taken
+        existing.name += ".old"
+    
+    obj.name = target
+
+
+# Bytes rewritten per vertex by Mesh.transform (position, float3)
+VERTEX_WRITE_BYTES = 12
+
+
+def resolve_origin_mode(high_poly, mode):
+    """'AUTO' transforms single-user meshes and parents shared ones."""
+    if mode == 'AUTO':
+        return 'TRANSFORM' if high_poly.data.users == 1 else 'PARENT'
+    return mode
+
+
+def origin_write_cost(high_poly, mode):
+    """Vertices (and bytes) origin matching would rewrite on ``high_poly``."""
+    if resolve_origin_mode(high_poly, mode) != 'TRANSFORM':
+        return 0, 0
+    count = len(high_poly.data.vertices)
+    return count, count * VERTEX_WRITE_BYTES
+
+
+def match_origin(low_poly, high_poly, mode='TRANSFORM'):
+    """Move the high poly's origin onto the low poly's, keeping the geometry in place.
+
+    TRANSFORM rewrites every vertex (and every other user of the mesh).
+    PARENT leaves the mesh alone and parents the high poly to an empty
+    sitting on the low poly's origin. Returns the mode used.
+    """
+    mode = resolve_origin_mode(high_poly, mode)
+    old_high_mat = high_poly.matrix_world.copy()
+    target_mat = low_poly.matrix_world.copy()
+
+    if mode == 'PARENT':
+        name = f"{high_poly.name}_origin"
+        empty = bpy.data.objects.get(name)
+        if empty is None or empty.type != 'EMPTY':
+            empty = bpy.data.objects.new(name, None)
+            empty.empty_display_type = 'PLAIN_AXES'
+            for col in high_poly.users_collection:
+                col.objects.link(empty)
+        empty.parent = None
+        empty.matrix_world = target_mat
+        high_poly.parent = empty
+        # world = empty @ inverse(empty) @ basis, so the basis is the old world
+        high_poly.matrix_parent_inverse = target_mat.inverted()
+        high_poly.matrix_basis = old_high_mat
+        return mode
+    
+    high_poly.matrix_world = target_mat
+    high_poly.data.transform(target_mat.inverted() @ old_high_mat)
+    return mode
+
+
+class PairMatcher:
+    """Pairs low and high poly meshes by cleaned base name.
+
+    Objects are indexed once by ``clean_base_name``. Within a name group the
+    collection and name suffixes decide; a leftover low/high pair is matched
+    by collection base name. Evaluated vertex counts are only looked at for a
+    two-object group where neither object has a low/high suffix.
+    """
+
+    def __init__(self, context, objects):
+        self.context = context
+        self.objects = objects
+        self.pairs = []      # (base, low, high, rule)
+        self.unmatched = []  # (object, reason)
+        self._depsgraph = None
+
+    def vertex_count(self, obj):
+        if self._depsgraph is None:
+            self._depsgraph = self.context.evaluated_depsgraph_get()
+        return len(obj.evaluated_get(self._depsgraph).data.vertices)
+
+    def run(self):
+        groups = {}
+        for obj in self.objects:
+            base = clean_base_name(obj.name)
+            groups.setdefault(base.lower(), (base, []))[1].append(obj)
+
+        for base, members in groups.values():
+            if len(members) < 2:
+                self.unmatched.append((members[0], "no partner"))
+                continue
+            self.match_group(base, members)
+        return self
+
+    def match_group(self, base, members):
+        lows, highs, unknown = [], [], []
+        for obj in members:
+            rating = get_type_rating(obj)
+            (lows if rating < 0 else highs if rating > 0 else unknown).append(obj)
+
+        if len(lows) == 1 and len(highs) == 1 and not unknown:
+            self.pairs.append((base, lows[0], highs[0], "suffix"))
+        elif len(members) == 2 and len(unknown) == 1:
+            # one side named, the other one is the opposite
+            other = unknown[0]
+            if lows:
+                self.pairs.append((base, lows[0], other, "suffix"))
+            else:
+                self.pairs.append((base, other, highs[0], "suffix"))
+        elif len(unknown) == 2:
+            # no suffix on either: fall back to vertex count
+            a, b = members
+            if self.vertex_count(a) > self.vertex_count(b):
+                a, b = b, a
+            self.pairs.append((base, a, b, "vertex count"))
+        elif len(members) == 2:
+            # both low or both high, e.g. a duplicate: never guess a side
+            for obj in members:
+                self.unmatched.append((obj, "partner has the same low/high suffix"))
+        else:
+            self.match_by_collection(base, lows, highs)
+            for obj in unknown:
+                self.unmatched.append((obj, "ambiguous group"))
+
+    def match_by_collection(self, base, lows, highs):
+        def collection_base(obj):
+            col = obj.users_collection[0] if obj.users_collection else None
+            return clean_base_name(col.name).lower() if col else ""
+
+        by_collection = {}
+        for obj in highs:
+            by_collection.setdefault(collection_base(obj), []).append(obj)
+        for low in lows:
+            candidates = by_collection.get(collection_base(low))
+            if candidates:
+                self.pairs.append((base, low, candidates.pop(0), "collection"))
+            else:
+                self.unmatched.append((low, "no high in matching collection"))
+        for candidates in by_collection.values():
+            for high in candidates:
+                self.unmatched.append((high, "no low in matching collection"))
+
 
 class MESH_OT_auto_rename_high_low(bpy.types.Operator):
     bl_idname = "mesh.auto_rename_high_low"
@@ -21,27 +184,6 @@ class MESH_OT_auto_rename_high_low(bpy.types.Operator):
             
         obj1, obj2 = selected_objects
         
-        # Suffixes to check
-        low_suffixes = ["_low", "_lp", "_lowpoly", "low", "lp", "lowpoly", ".low", " low", "-low"]
-        high_suffixes = ["_high", "_hp", "_highpoly", "high", "hp", "highpoly", ".high", " high", "-high"]
-        
-        def get_type_rating(obj):
-            # Check collections
-            for col in obj.users_collection:
-                n = col.name.lower()
-                if any(n.endswith(s) for s in low_suffixes):
-                    return -2 # Strongly low
-                if any(n.endswith(s) for s in high_suffixes):
-                    return 2 # Strongly high
-            
-            # Check names
-            n = obj.name.lower()
-            if any(n.endswith(s) for s in low_suffixes):
-                return -1 # Likely low
-            if any(n.endswith(s) for s in high_suffixes):
-                return 1 # Likely high
-            return 0
-
         r1 = get_type_rating(obj1)
         r2 = get_type_rating(obj2)
         
@@ -61,20 +203,7 @@ class MESH_OT_auto_rename_high_low(bpy.types.Operator):
 
     @staticmethod
     def clean_base_name(name):
-        import re
-        # Remove trailing .001, .002 etc
-        name = re.sub(r'\.\d{3,}$', '', name)
-        
-        low_suffixes = ["_low", "_lp", "_lowpoly", "low", "lp", "lowpoly", ".low", " low", "-low"]
-        high_suffixes = ["_high", "_hp", "_highpoly", "high", "hp", "highpoly", ".high", " high", "-high"]
-        
-        # Strip common suffixes (case insensitive endswith)
-        for s in low_suffixes + high_suffixes:
-            if name.lower().endswith(s):
-                name = name[:-len(s)]
-                # Recursively check in case of multiple suffixes like Name_low.001
-                return MESH_OT_auto_rename_high_low.clean_base_name(name)
-        return name
+        return clean_base_name(name)
 
     def execute(self, context):
         selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
@@ -100,19 +229,6 @@ class MESH_OT_auto_rename_high_low(bpy.types.Operator):
         target_low = props.obj_name + props.low_prefix
         target_high = props.obj_name + props.high_prefix
 
-        def safe_rename(obj, target):
-            if obj.name == target:
-                return
-            
-            # If target name is taken by ANY other object
-            existing = bpy.data.objects.get(target)
-            if existing and existing != obj:
-                # Rename the conflicting object to free up the name
-                # We append .old and potentially another number if .old is taken
-                existing.name += ".old"
-            
-            obj.name = target
-
         # Use temporary names first to avoid swapping conflicts within selection
         low_poly.name = "__rextools_tmp_low__"
         high_poly.name = "__rextools_tmp_high__"
@@ -121,11 +237,7 @@ class MESH_OT_auto_rename_high_low(bpy.types.Operator):
         safe_rename(high_poly, target_high)
         
         # 5. Match Origins
-        old_high_mat = high_poly.matrix_world.copy()
-        target_mat = low_poly.matrix_world.copy()
-        
-        high_poly.matrix_world = target_mat
-        high_poly.data.transform(target_mat.inverted() @ old_high_mat)
+        match_origin(low_poly, high_poly, props.origin_mode)
         
         context.view_layer.update()
 
@@ -149,3 +261,62 @@ class MESH_OT_auto_rename_high_low_detect(bpy.types.Operator):
                 context.scene.highlow_renamer_props.obj_name = name
         return {'FINISHED'}
 
+
+class MESH_OT_batch_rename_high_low(bpy.types.Operator):
+    bl_idname = "mesh.batch_rename_high_low"
+    bl_label = "Batch Rename High/Low"
+    bl_description = "Pair low and high poly meshes by base name, rename them and match origins"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: EnumProperty(
+        name="Scope",
+        items=[
+            ('SELECTED', "Selected", "Selected meshes only"),
+            ('SCENE', "Scene", "Every mesh in the view layer"),
+        ],
+        default='SELECTED'
+    )
+    match_origins: BoolProperty(name="Match Origins", default=True)
+    dry_run: BoolProperty(
+        name="Dry Run",
+        description="Only print the pairs that would be renamed",
+        default=False
+    )
+
+    def execute(self, context):
+        props = context.scene.highlow_renamer_props
+        if self.scope == 'SCENE':
+            objects = [obj for obj in context.view_layer.objects if obj.type == 'MESH']
+        else:
+            objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'ERROR'}, "No mesh objects to match")
+            return {'CANCELLED'}
+
+        matcher = PairMatcher(context, objects).run()
+
+        # Detailed console output
+        print(f"\n--- RexTools3 High/Low Pairs{' (dry run)' if self.dry_run else ''} ---")
+        for base, low, high, rule in matcher.pairs:
+            print(f"{base}: {low.name} -> {base}{props.low_prefix} | {high.name} -> {base}{props.high_prefix} ({rule})")
+        for obj, reason in matcher.unmatched:
+            print(f"UNMATCHED: {obj.name} ({reason})")
+        print("--------------------------------\n")
+
+        if self.dry_run:
+            self.report({'INFO'}, f"{len(matcher.pairs)} pairs found, {len(matcher.unmatched)} unmatched (see console)")
+            return {'FINISHED'}
+
+        # Temporary names first so swaps inside the batch don't collide
+        for i, (_, low, high, _) in enumerate(matcher.pairs):
+            low.name = f"__rextools_tmp_low_{i}__"
+            high.name = f"__rextools_tmp_high_{i}__"
+        for base, low, high, _ in matcher.pairs:
+            safe_rename(low, base + props.low_prefix)
+            safe_rename(high, base + props.high_prefix)
+            if self.match_origins:
+                match_origin(low, high, props.origin_mode)
+
+        context.view_layer.update()
+        self.report({'INFO'}, f"Renamed {len(matcher.pairs)} pairs, {len(matcher.unmatched)} unmatched (see console)")
+        return {'FINISHED'}
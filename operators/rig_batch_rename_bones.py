@@ -1,5 +1,230 @@
 import bpy
+import re
 from bpy.types import Operator
+from bpy.app.handlers import persistent
+
+# Bone references inside F-curve data paths: pose.bones["Name"] / bones["Name"]
+BONE_PATH = re.compile(r'((?:pose\.)?bones\[")((?:[^"\\]|\\.)*)("\])')
+
+
+def compile_find(props):
+    """Compiled find pattern (regex or literal). Raises re.error on a bad regex."""
+    if not props.find_text:
+        return None
+    return re.compile(props.find_text if props.use_regex else re.escape(props.find_text))
+
+
+def new_bone_name(name, props, pattern):
+    """Name after find/replace and prefix/suffix (same name if nothing applies)."""
+    new_name = name
+    found_match = False
+
+    if pattern is not None and pattern.search(name):
+        if props.use_regex:
+            # capture groups: \1 or \g<name> in the replace text
+            new_name = pattern.sub(props.replace_text, new_name)
+        else:
+            new_name = new_name.replace(props.find_text, props.replace_text)
+        found_match = True
+
+    if props.prefix_text or props.suffix_text:
+        should_apply_prefix_suffix = props.apply_prefix_suffix_to_matches_only and found_match or not props.apply_prefix_suffix_to_matches_only
+
+        if should_apply_prefix_suffix:
+            new_name = props.prefix_text + new_name + props.suffix_text
+
+    return new_name
+
+
+def build_rename_map(bone_names, props, pattern):
+    """old name -> new name for every bone that changes."""
+    rename_map = {}
+    for name in bone_names:
+        new_name = new_bone_name(name, props, pattern)
+        if new_name != name:
+            rename_map[name] = new_name
+    return rename_map
+
+
+class RenamePlan:
+    """Rename map of one armature plus the problems Blender would hide.
+
+    ``collisions``: bones whose new name is also the final name of another
+    bone (Blender would auto-suffix one of them). ``cycles``: bones whose
+    renames form a loop (a -> b -> a); those are fine, just worth showing.
+    """
+
+    def __init__(self, bone_names, props):
+        self.error = None
+        try:
+            self.rename_map = build_rename_map(bone_names, props, compile_find(props))
+        except re.error as e:
+            self.error = str(e)
+            self.rename_map = {}
+        rename_map = self.rename_map
+
+        # final name -> bones ending up with it
+        final = {}
+        for name in bone_names:
+            final.setdefault(rename_map.get(name, name), []).append(name)
+        self.collisions = {
+            name for names in final.values() if len(names) > 1 for name in names if name in rename_map
+        }
+
+        # rename chains form a functional graph, walk each one once
+        self.cycles = set()
+        state = {}  # name -> 1 on the current walk, 2 done
+        for start in rename_map:
+            path = []
+            name = start
+            while name in rename_map and name not in state:
+                state[name] = 1
+                path.append(name)
+                name = rename_map[name]
+            if state.get(name) == 1:
+                self.cycles.update(path[path.index(name):])
+            for visited in path:
+                state[visited] = 2
+
+        self.changed = [name in rename_map for name in bone_names]
+        self._flags = None
+
+    def filter_flags(self, bit):
+        """UIList filter flags (only renamed bones), built once."""
+        if self._flags is None:
+            self._flags = [bit if changed else 0 for changed in self.changed]
+        return self._flags
+
+
+_plans = {}  # armature data name -> (key, RenamePlan)
+
+
+def _props_key(props):
+    return (
+        props.find_text, props.replace_text, props.prefix_text, props.suffix_text,
+        props.apply_prefix_suffix_to_matches_only, props.use_regex,
+    )
+
+
+def get_rename_plan(armature, props):
+    """Cached RenamePlan for ``armature``; recomputed when the rename settings or
+    the bones change. Cheap enough to call from draw()."""
+    bones = armature.data.bones
+    key = (_props_key(props), len(bones))
+    cached = _plans.get(armature.data.name_full)
+    if cached is None or cached[0] != key:
+        cached = _plans[armature.data.name_full] = (key, RenamePlan([bone.name for bone in bones], props))
+    return cached[1]
+
+
+def invalidate_plan(armature):
+    _plans.pop(armature.data.name_full, None)
+
+
+def apply_bone_renames(armature, rename_map):
+    """Rename bones in object mode, each bone once where possible.
+
+    A bone whose new name is still held by another bone of the map waits for
+    that bone to move first (chains). Only loops (a -> b -> a) park one bone
+    under a temporary name. Returns old name -> the name the bone really got,
+    which differs from the map where Blender auto-suffixed a collision.
+    """
+    bones = armature.data.bones
+    final = {}
+    parked = {}  # old name -> temporary name
+    for start in rename_map:
+        if start in final:
+            continue
+        # follow the chain while the wanted name belongs to a bone still to move
+        path = [start]
+        on_path = {start}
+        name = rename_map[start]
+        while name in rename_map and name not in final and name not in parked:
+            if name in on_path:
+                parked[name] = f"__rextools3_bone_{len(parked)}__"
+                bones[name].name = parked[name]
+                break
+            path.append(name)
+            on_path.add(name)
+            name = rename_map[name]
+        for old_name in reversed(path):
+            bone = bones[parked.get(old_name, old_name)]
+            bone.name = rename_map[old_name]
+            final[old_name] = bone.name
+    return final
+
+
+def deformed_meshes(armature):
+    """Mesh objects deformed by (or parented to) ``armature``."""
+    meshes = []
+    for obj in bpy.data.objects:
+        if obj.type != 'MESH':
+            continue
+        if obj.parent == armature or any(
+            mod.type == 'ARMATURE' and mod.object == armature for mod in obj.modifiers
+        ):
+            meshes.append(obj)
+    return meshes
+
+
+def rename_vertex_groups(objects, rename_map):
+    """Rename vertex groups still using old bone names. Returns how many changed."""
+    renamed = 0
+    for obj in objects:
+        for group in obj.vertex_groups:
+            new_name = rename_map.get(group.name)
+            if new_name is not None and obj.vertex_groups.get(new_name) is None:
+                group.name = new_name
+                renamed += 1
+    return renamed
+
+
+def rename_fcurve_paths(actions, rename_map):
+    """Rewrite bone names in F-curve data paths with one regex pass per curve.
+    Returns how many curves changed."""
+    def replace(match):
+        name = rename_map.get(match.group(2))
+        return match.group(0) if name is None else match.group(1) + name + match.group(3)
+
+    renamed = 0
+    for action in actions:
+        for fcurve in action.fcurves:
+            path = fcurve.data_path
+            if 'bones["' not in path:
+                continue
+            new_path = BONE_PATH.sub(replace, path)
+            if new_path != path:
+                fcurve.data_path = new_path
+                renamed += 1
+    return renamed
+
+
+def action_bone_names(action):
+    """Bone names the F-curve data paths of ``action`` refer to."""
+    names = set()
+    for fcurve in action.fcurves:
+        path = fcurve.data_path
+        if 'bones["' in path:
+            names.update(match.group(2) for match in BONE_PATH.finditer(path))
+    return names
+
+
+def actions_for_bones(actions, bone_names):
+    """The ``actions`` whose bone F-curves all resolve against ``bone_names``.
+    An action made for another rig refers to bones this one doesn't have."""
+    matched = []
+    for action in actions:
+        names = action_bone_names(action)
+        if names and names <= bone_names:
+            matched.append(action)
+    return matched
+
+
+def unused_actions():
+    """Actions nothing is using (only kept by a fake user, if at all). Blender
+    fixes the paths of assigned and NLA actions itself when a bone is renamed."""
+    return [a for a in bpy.data.actions if a.users - int(a.use_fake_user) == 0]
+
 
 class ARMATURE_OT_batch_rename_bones(Operator):
     """Batch rename bones using find and replace"""
@@ -15,7 +240,6 @@ class ARMATURE_OT_batch_rename_bones(Operator):
 
     def execute(self, context):
         props = context.scene.bone_rename_props
-        armature = context.active_object
 
         has_find_replace = bool(props.find_text)
         has_prefix_suffix = bool(props.prefix_text or props.suffix_text)
@@ -24,48 +248,53 @@ class ARMATURE_OT_batch_rename_bones(Operator):
             self.report({'WARNING'}, "Specify find/replace text or prefix/suffix")
             return {'CANCELLED'}
 
-        original_mode = context.mode
-        bpy.context.view_layer.objects.active = armature
-        bpy.ops.object.mode_set(mode='EDIT')
+        # All selected armatures, the active one included
+        armatures = [obj for obj in context.selected_objects if obj.type == 'ARMATURE']
+        if context.active_object not in armatures:
+            armatures.append(context.active_object)
 
         renamed_count = 0
+        group_count = 0
+        collision_count = 0
+        curve_count = 0
+        summary = []
+        actions = unused_actions() if props.update_unused_actions else []
 
-        try:
-            for bone in armature.data.edit_bones:
-                old_name = bone.name
-                new_name = old_name
-                should_rename = False
-                found_match = False
-
-                if has_find_replace and props.find_text in old_name:
-                    new_name = new_name.replace(props.find_text, props.replace_text)
-                    should_rename = True
-                    found_match = True
-
-                if has_prefix_suffix:
-                    should_apply_prefix_suffix = props.apply_prefix_suffix_to_matches_only and found_match or not props.apply_prefix_suffix_to_matches_only
-
-                    if should_apply_prefix_suffix:
-                        if props.prefix_text:
-                            new_name = props.prefix_text + new_name
-                        if props.suffix_text:
-                            new_name = new_name + props.suffix_text
-                        should_rename = True
-
-                if should_rename and new_name != old_name:
-                    bone.name = new_name
-                    renamed_count += 1
-                    print(f"Renamed: {old_name} -> {bone.name}")
-
-        except Exception as e:
-            self.report({'ERROR'}, f"Error renaming bones: {str(e)}")
-            return {'CANCELLED'}
+        # Bones are renamed in object mode through armature.data.bones, no edit-mode round-trip
+        for armature in armatures:
+            # rebuilt from the current bones (same rules as the panel preview):
+            # a cached plan can be stale if a script renamed bones since
+            bone_names = [bone.name for bone in armature.data.bones]
+            plan = RenamePlan(bone_names, props)
+            if plan.error:
+                self.report({'ERROR'}, f"Invalid find/replace: {plan.error}")
+                return {'CANCELLED'}
+            rename_map = plan.rename_map
+            if not rename_map:
+                continue
+            # unused actions made for this rig: every bone they animate is one of its bones
+            own_actions = actions_for_bones(actions, set(bone_names))
+            actions = [action for action in actions if action not in own_actions]
+            collision_count += len(plan.collisions)
+            # the names bones really got (auto-suffixed on collisions)
+            rename_map = apply_bone_renames(armature, rename_map)
+            invalidate_plan(armature)
+            group_count += rename_vertex_groups(deformed_meshes(armature), rename_map)
+            curve_count += rename_fcurve_paths(own_actions, rename_map)
+            renamed_count += len(rename_map)
+            summary.append((armature.name, len(rename_map)))
 
-        finally:
-            bpy.ops.object.mode_set(mode='OBJECT')
+        if summary:
+            print("\n--- RexTools3 Bone Rename Summary ---")
+            for name, count in summary:
+                print(f"{name}: {count} bones")
+            print(f"Vertex groups fixed: {group_count}, unused action curves updated: {curve_count}")
+            print("--------------------------------\n")
 
-        if renamed_count > 0:
-            self.report({'INFO'}, f"Renamed {renamed_count} bone(s)")
+        if collision_count:
+            self.report({'WARNING'}, f"Renamed {renamed_count} bone(s), {collision_count} name collision(s) got auto-suffixed")
+        elif renamed_count > 0:
+            self.report({'INFO'}, f"Renamed {renamed_count} bone(s) on {len(summary)} armature(s)")
         else:
             if has_find_replace:
                 self.report({'WARNING'}, f"No bones found containing '{props.find_text}'")
@@ -73,3 +302,33 @@ class ARMATURE_OT_batch_rename_bones(Operator):
                 self.report({'WARNING'}, "No bones were renamed")
 
         return {'FINISHED'}
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not _plans:
+        return
+    for update in depsgraph.updates:
+        data = update.id.original
+        if isinstance(data, bpy.types.Armature):
+            _plans.pop(data.name_full, None)
+
+
+@persistent
+def _on_load_post(*args):
+    _plans.clear()
+
+
+def register():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _plans.clear()
@@ -2,9 +2,11 @@ import bpy, bmesh, gpu, blf
 from gpu_extras.batch import batch_for_shader
 from bpy.props import FloatProperty
 from ..ui import overlay as overlay_drawer
+from .mesh_utils import SeedSnapshot, deselect_faces, selected_face_indices
+from .modal_utils import ThrottledModalMixin
 import time
 
-class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
+class REXTOOLS3_OT_select_similar_modal(ThrottledModalMixin, bpy.types.Operator):
     bl_idname = "rextools3.select_similar_modal"
     bl_label = "Select by Similar (drag/scroll to adjust)"
     bl_options = {'REGISTER', 'UNDO', 'GRAB_CURSOR', 'BLOCKING'}
@@ -21,7 +23,9 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
 
         # store seed faces
         bm = bmesh.from_edit_mesh(obj.data)
-        self.seed_indices = [f.index for f in bm.faces if f.select]
+        self.seeds = SeedSnapshot(bm, 'FACE')
+        # faces the previous pass selected, cleared before the next one
+        self.selected = self.seeds.indices.tolist()
 
         # initial state
         self.start_mouse = (event.mouse_region_x, event.mouse_region_y)
@@ -45,23 +49,27 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
             self._draw_overlay, (context,), 'WINDOW', 'POST_PIXEL'
         )
 
+        # recompute on a timer instead of per MOUSEMOVE
+        self._throttle_start(context)
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
+    def _recompute(self, context):
+        self._restore_and_select(context)
+
     def _restore_and_select(self, context):
         obj = context.object
+        # deselect the previous pass, reselect the seeds
         bm = bmesh.from_edit_mesh(obj.data)
-        # deselect all, reselect the seeds
-        for f in bm.faces:
-            f.select = False
-        for idx in self.seed_indices:
-            bm.faces[idx].select = True
-        bmesh.update_edit_mesh(obj.data)
+        deselect_faces(bm, self.selected)
+        self.seeds.restore(bm)
+        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
         # run similarity select
         bpy.ops.mesh.select_similar(
             type=self.sim_type,
             threshold=self.threshold
         )
+        self.selected = selected_face_indices(bmesh.from_edit_mesh(obj.data))
 
     def _draw_overlay(self, context):
         sx, sy = self.start_mouse
@@ -80,6 +88,9 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
         
         # 2. Threshold
         mov.add_progress("Threshold", "Drag Mouse L/R", self.threshold, 0.0, 1.0)
+
+        # 3. Recompute latency
+        mov.add_value("Recompute", "Latency", self.latency_summary())
         
         mov.draw()
 
@@ -91,6 +102,10 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
 
     def modal(self, context, event):
         wm = context.window_manager
+
+        # ——— coalesced recompute ———
+        if self._throttle_tick(context, event):
+            return {'RUNNING_MODAL'}
         
         # ——— scroll wheel switches sim_type ——
         if event.type == 'WHEELUPMOUSE' and event.value == 'PRESS':
@@ -105,8 +120,8 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
         if event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
             # update sim_type
             self.sim_type = self.SIM_TYPES[self.type_index]
-            # reapply from seeds with same threshold
-            self._restore_and_select(context)
+            # reapply from seeds with same threshold (next timer tick)
+            self._request_recompute(context)
             # force redraw for overlay & viewport
             if context.area:
                 context.area.tag_redraw()
@@ -118,8 +133,8 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
             dist = abs(self.current_mouse[0] - self.start_mouse[0])
             self.threshold = min(dist * self.sensitivity, 1.0)
 
-            # reapply selection base-on-seed
-            self._restore_and_select(context)
+            # reapply selection base-on-seed (next timer tick)
+            self._request_recompute(context)
 
             # force redraw so overlay and viewport update
             if context.area:
@@ -128,6 +143,9 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
 
         # finish: remove handler, keep selection, then chain region_to_loop
         if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+            self._throttle_flush(context)
+            self._throttle_stop(context)
+            self._report_latency()
             bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
             # optional: call next operator
             bpy.ops.mesh.region_to_loop()
@@ -135,6 +153,7 @@ class REXTOOLS3_OT_select_similar_modal(bpy.types.Operator):
 
         # cancel: remove handler and abort
         if event.type in {'RIGHTMOUSE', 'ESC'}:
+            self._throttle_stop(context)
             bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
             return {'CANCELLED'}
 
@@ -1,10 +1,78 @@
 import bpy
 from bpy.types import Operator
+from bpy.props import BoolProperty, EnumProperty
 from ..core import notify
+from .uv_utils import unique_meshes
 
 addon_keymaps = []
 
 
+def _unmatched_uv_names(mesh, names):
+    """(layers of ``mesh`` whose name isn't in ``names``, names ``mesh`` lacks)."""
+    current = [uv.name for uv in mesh.uv_layers]
+    unmatched = [name for name in current if name not in names]
+    free = [name for name in names if name not in current]
+    return unmatched, free
+
+
+def canonical_uv_layout(meshes, reference=None):
+    """UV layer names shared by all meshes: the reference mesh's layers plus
+    the layers of other meshes that can't take one of those names."""
+    names = [uv.name for uv in reference.uv_layers] if reference else []
+    for mesh in meshes:
+        unmatched, free = _unmatched_uv_names(mesh, names)
+        names.extend(unmatched[len(free):])
+    return names
+
+
+def reconcile_uv_layers(mesh, names):
+    """Line the UV layers of ``mesh`` up with ``names`` for a join.
+
+    Layers already named like a canonical layer keep their name, so their
+    data stays on that channel. Only layers without a name match are renamed,
+    in order, to the canonical names the mesh lacks; empty layers are added
+    for the rest. Join merges by name, so the order doesn't matter.
+    Returns True if anything changed."""
+    layers = mesh.uv_layers
+    unmatched, free = _unmatched_uv_names(mesh, names)
+    changed = False
+    for old_name, new_name in zip(unmatched, free):
+        layers[old_name].name = new_name
+        changed = True
+    for name in free[len(unmatched):]:
+        if layers.new(name=name, do_init=False) is None:
+            break  # layer limit reached
+        changed = True
+    return changed
+
+
+def reconcile_uvs(objects, reference):
+    """Give every mesh of ``objects`` the same UV layout, based on ``reference``.
+    Returns the number of meshes changed."""
+    meshes = unique_meshes(objects)
+    names = canonical_uv_layout(meshes, reference.data)
+    return sum(reconcile_uv_layers(mesh, names) for mesh in meshes)
+
+
+def join_objects(context, objects, target):
+    """Join ``objects`` into ``target`` without touching the selection."""
+    with context.temp_override(
+        active_object=target,
+        object=target,
+        selected_objects=objects,
+        selected_editable_objects=objects,
+    ):
+        bpy.ops.object.join()
+    return target
+
+
+def join_group_key(obj, group_by):
+    if group_by == 'COLLECTION':
+        return obj.users_collection[0].name if obj.users_collection else ""
+    mat = obj.material_slots[0].material if obj.material_slots else None
+    return mat.name if mat else ""
+
+
 class REXTOOLS3_OT_SmartJoin(Operator):
     """Join objects with UV mismatch checking"""
     bl_idname = "rextools3.smart_join"
@@ -12,6 +80,12 @@ class REXTOOLS3_OT_SmartJoin(Operator):
     bl_description = "Join selected objects with UV mismatch checking"
     bl_options = {'REGISTER', 'UNDO'}
 
+    reconcile: BoolProperty(
+        name="Reconcile UVs",
+        description="Match UV maps to the active object's by name, rename unmatched ones in order and add missing ones before joining",
+        default=True
+    )
+
     @classmethod
     def poll(cls, context):
         return (
@@ -58,6 +132,13 @@ class REXTOOLS3_OT_SmartJoin(Operator):
             self.report({'WARNING'}, "Need at least 2 mesh objects selected")
             return {'CANCELLED'}
         
+        active = context.active_object
+        if self.reconcile and active in selected_meshes:
+            # Join merges UV maps by name, so line the names up first
+            changed = reconcile_uvs(selected_meshes, active)
+            if changed:
+                self.report({'INFO'}, f"Reconciled UV maps on {changed} meshes")
+
         # Check for UV mismatches
         has_mismatch, message = self.check_uv_mismatch(selected_meshes)
         
@@ -76,6 +157,62 @@ class REXTOOLS3_OT_SmartJoin(Operator):
         return {'FINISHED'}
 
 
+class REXTOOLS3_OT_BulkJoin(Operator):
+    """Join selected meshes into one object per collection or material"""
+    bl_idname = "rextools3.bulk_join"
+    bl_label = "Bulk Join"
+    bl_description = "Join selected meshes into one object per collection or per first material, reconciling UV maps"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    group_by: EnumProperty(
+        name="Group By",
+        items=[
+            ('COLLECTION', "Collection", "One object per (first) collection"),
+            ('MATERIAL', "Material", "One object per first material"),
+        ],
+        default='COLLECTION'
+    )
+    reconcile: BoolProperty(
+        name="Reconcile UVs",
+        description="Match UV maps by name, rename unmatched ones in order and add missing ones before joining",
+        default=True
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and any(obj.type == 'MESH' for obj in context.selected_objects)
+
+    def execute(self, context):
+        groups = {}
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                groups.setdefault(join_group_key(obj, self.group_by), []).append(obj)
+
+        results = []
+        for key, objects in groups.items():
+            if len(objects) < 2:
+                continue
+            target = objects[0]
+            if self.reconcile:
+                reconcile_uvs(objects, target)
+            try:
+                join_objects(context, objects, target)
+                results.append((key, target.name, len(objects)))
+            except Exception as e:
+                self.report({'WARNING'}, f"Join failed for '{key or 'None'}': {e}")
+
+        print("\n--- RexTools3 Bulk Join Summary ---")
+        for key, name, count in results:
+            print(f"{key or 'None'}: {count} objects -> {name}")
+        print("--------------------------------\n")
+
+        if not results:
+            notify.warning("Nothing to join: every group has a single object")
+            return {'CANCELLED'}
+        notify.success(f"Joined {sum(r[2] for r in results)} objects into {len(results)} objects")
+        return {'FINISHED'}
+
+
 def register():
     wm = bpy.context.window_manager
     kc = wm.keyconfigs.addon
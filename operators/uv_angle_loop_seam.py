@@ -33,53 +33,59 @@ class MESH_OT_uv_angle_loop_seam(bpy.types.Operator):
     )
 
     def execute(self, context):
-        from .mesh_utils import crawl
-        obj = context.active_object
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "Active object is not a mesh")
-            return {'CANCELLED'}
-        
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.edges.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
-
-        # Identify external seeds (explicitly selected by user)
-        # and existing seams to avoid jumping over them in the first step
-        selected_seeds = [e for e in bm.edges if e.select]
-        if not selected_seeds:
-            self.report({'WARNING'}, "No edge selected to start crawling")
+        from .mesh_utils import crawl, edit_mesh_objects
+        objects = edit_mesh_objects(context)
+        if not objects:
+            self.report({'ERROR'}, "No mesh in Edit Mode")
             return {'CANCELLED'}
 
-        # We'll build a set of edges that SHOULD be selected/marked
-        edges_to_select = set(selected_seeds)
-        
         # Convert thresholds to radians
         angle_tol = math.radians(self.angle_threshold)
         straight_tol = math.radians(self.straightness_threshold)
         
         stop_at_seam = context.window_manager.stop_loop_at_seam
 
-        for start_edge in selected_seeds:
-            # Initial dihedral angle
-            try:
-                ref_angle = start_edge.calc_face_angle()
-            except ValueError:
-                ref_angle = 0.0
+        # Every object in edit mode is handled in this one call (one undo step)
+        crawled = 0
+        for obj in objects:
+            bm = bmesh.from_edit_mesh(obj.data)
+            bm.edges.ensure_lookup_table()
+            bm.verts.ensure_lookup_table()
 
-            # Crawl both directions from the start edge
-            for start_vert in start_edge.verts:
-                # We pass 'selected_seeds' to crawl logic as "already visited" 
-                # to prevent immediate backtracking or jumping within the seed selection.
-                # However, the crawl core needs to know which edges it just added.
-                crawl(start_edge, start_vert, ref_angle, edges_to_select, angle_tol, straight_tol, stop_at_seam, self.max_steps)
+            # Identify external seeds (explicitly selected by user)
+            # and existing seams to avoid jumping over them in the first step
+            selected_seeds = [e for e in bm.edges if e.select]
+            if not selected_seeds:
+                continue
 
-        # Apply results
-        # NOTE: When the redo panel updates, Blender resets the mesh to the state 
-        # BEFORE the first execute. So we just need to set our calculated set.
-        for e in edges_to_select:
-            e.select = True
-            e.seam = True
+            # We'll build a set of edges that SHOULD be selected/marked
+            edges_to_select = set(selected_seeds)
 
-        bmesh.update_edit_mesh(obj.data)
-        return {'FINISHED'}
+            for start_edge in selected_seeds:
+                # Initial dihedral angle
+                try:
+                    ref_angle = start_edge.calc_face_angle()
+                except ValueError:
+                    ref_angle = 0.0
 
+                # Crawl both directions from the start edge
+                for start_vert in start_edge.verts:
+                    # We pass 'selected_seeds' to crawl logic as "already visited" 
+                    # to prevent immediate backtracking or jumping within the seed selection.
+                    # However, the crawl core needs to know which edges it just added.
+                    crawl(start_edge, start_vert, ref_angle, edges_to_select, angle_tol, straight_tol, stop_at_seam, self.max_steps)
+
+            # Apply results
+            # NOTE: When the redo panel updates, Blender resets the mesh to the state 
+            # BEFORE the first execute. So we just need to set our calculated set.
+            for e in edges_to_select:
+                e.select = True
+                e.seam = True
+
+            bmesh.update_edit_mesh(obj.data)
+            crawled += 1
+
+        if not crawled:
+            self.report({'WARNING'}, "No edge selected to start crawling")
+            return {'CANCELLED'}
+        return {'FINISHED'}
@@ -1,4 +1,5 @@
 import bpy, bmesh
+from .mesh_utils import edit_mesh_objects, region_border_edges, seam_islands
 
 class REXTOOLS3_OT_uvAreaSeam(bpy.types.Operator):
     bl_idname = "rextools3.uv_area_seam"
@@ -9,14 +10,6 @@ class REXTOOLS3_OT_uvAreaSeam(bpy.types.Operator):
     def execute(self, context):
         wm = context.window_manager
         
-        obj = context.object
-        # store original seeds
-        bm = bmesh.from_edit_mesh(obj.data) 
-        self.seed_indices = [f.index for f in bm.faces if f.select]
-        
-        # **VALIDATION**: require at least one face selected
-        
-        
         # 1) Clear Inner: wipe all seams, then region→loop, then mark loop
         if wm.clear_inner_uv_area_seam:
             bpy.ops.mesh.mark_seam(clear=True)
@@ -24,35 +17,7 @@ class REXTOOLS3_OT_uvAreaSeam(bpy.types.Operator):
             bpy.ops.mesh.mark_seam(clear=False)
             
         elif wm.reseam_uv_area_seam:
-            # 1) mark/unmark seams on selected edges
-            bpy.ops.mesh.region_to_loop()
-            obj = context.object
-            me  = obj.data
-            bm  = bmesh.from_edit_mesh(me)
-            for e in bm.edges:
-                if e.select:
-                    e.seam = not e.seam
-            bmesh.update_edit_mesh(me)
-
-            # 2) only do an explicit unwrap if Live-Unwrap is enabled
-            if context.scene.tool_settings.use_edge_path_live_unwrap:
-                # select all faces so unwrap uses every island
-                bpy.ops.mesh.select_all(action='SELECT')
-                bpy.ops.uv.unwrap(
-                    method='MINIMUM_STRETCH',
-                    fill_holes=True,
-                    correct_aspect=True,
-                    use_subsurf_data=False,
-                    margin=0,
-                    no_flip=False,
-                    iterations=10,
-                    use_weights=False,
-                    weight_group="uv_importance",
-                    weight_factor=1
-                )
-                bpy.ops.mesh.select_all(action='DESELECT')
-
-
+            self.reseam(context)
             
          # 3) Normal: region→loop, then mark seam on loop
         else:
@@ -63,6 +28,59 @@ class REXTOOLS3_OT_uvAreaSeam(bpy.types.Operator):
         bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='FACE')
         return {'FINISHED'}
 
+    def reseam(self, context):
+        """Flip seams on the selection border in BMesh and re-unwrap only the
+        islands those seams touch (when Live-Unwrap is enabled)."""
+        live_unwrap = context.scene.tool_settings.use_edge_path_live_unwrap
+        touched = []
+
+        for obj in edit_mesh_objects(context):
+            me = obj.data
+            bm = bmesh.from_edit_mesh(me)
+            region = [f for f in bm.faces if f.select]
+            if not region:
+                continue
+
+            # 1) mark/unmark seams on the border only
+            border = region_border_edges(region)
+            for e in border:
+                e.seam = not e.seam
+
+            # leave the border selected, like region_to_loop does
+            for f in region:
+                f.select_set(False)
+            for e in border:
+                e.select_set(True)
+
+            if live_unwrap:
+                touched.append((obj, seam_islands(f for e in border for f in e.link_faces)))
+            bmesh.update_edit_mesh(me)
+
+        # 2) only do an explicit unwrap if Live-Unwrap is enabled,
+        #    and only for the islands around the changed seams
+        if not touched:
+            return
+
+        bpy.ops.mesh.select_all(action='DESELECT')
+        for obj, faces in touched:
+            for f in faces:
+                f.select_set(True)
+            bmesh.update_edit_mesh(obj.data)
+
+        bpy.ops.uv.unwrap(
+            method='MINIMUM_STRETCH',
+            fill_holes=True,
+            correct_aspect=True,
+            use_subsurf_data=False,
+            margin=0,
+            no_flip=False,
+            iterations=10,
+            use_weights=False,
+            weight_group="uv_importance",
+            weight_factor=1
+        )
+        bpy.ops.mesh.select_all(action='DESELECT')
+
 
 class WM_OT_toggle_clear_inner_seam(bpy.types.Operator):
     """Clear all inner seams before marking the loop seam"""
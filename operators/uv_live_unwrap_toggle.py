@@ -1,27 +1,58 @@
 import bpy
 
+# Live-unwrap state waiting for a UV editor to exist (None = nothing pending)
+_pending_state = None
+
+
+def _image_editor_spaces(wm):
+    # area.spaces also holds inactive spaces, so an area that used to be a
+    # UV editor picks the setting up when it is switched back
+    for window in wm.windows:
+        for area in window.screen.areas:
+            for space in area.spaces:
+                if space.type == 'IMAGE_EDITOR':
+                    yield space
+
+
+def apply_live_unwrap(wm, state):
+    """Set use_live_unwrap on every image/UV editor space. Returns how many were set."""
+    count = 0
+    for space in _image_editor_spaces(wm):
+        space.uv_editor.use_live_unwrap = state
+        count += 1
+    return count
+
+
+def _apply_pending():
+    global _pending_state
+    if _pending_state is None:
+        return None
+    if apply_live_unwrap(bpy.context.window_manager, _pending_state):
+        _pending_state = None
+        return None
+    return 1.0
+
+
 class REX_OT_toggle_live_unwrap(bpy.types.Operator):
     bl_idname = "rextools3.toggle_live_unwrap"
     bl_label = "Toggle Live Unwrap"
-    bl_description = "Temporarily switch this area to UV Editor, toggle live-unwrap, then restore"
+    bl_description = "Toggle live-unwrap on every UV editor (applied when one opens if none exists yet)"
 
     def execute(self, context):
-        area = context.area
+        global _pending_state
         tool = context.scene.tool_settings
 
         # flip the edge-path live unwrap flag
         new_state = not tool.use_edge_path_live_unwrap
 
-        # 1) switch this area to IMAGE_EDITOR so we can reach uv_editor
-        orig_type = area.type
-        try:
-            area.type = 'IMAGE_EDITOR'
-            space = area.spaces.active
-            uv = space.uv_editor            
-            uv.use_live_unwrap = new_state  
-        finally:
-            # 2) restore original area type
-            area.type = orig_type
+        # 1) set it on existing UV editor spaces, no area switching
+        if apply_live_unwrap(context.window_manager, new_state):
+            _pending_state = None
+        else:
+            # 2) no UV editor anywhere: remember it for the next one that opens
+            _pending_state = new_state
+            if not bpy.app.timers.is_registered(_apply_pending):
+                bpy.app.timers.register(_apply_pending, first_interval=1.0)
 
         # 3) ensure we're in Edit Mesh mode
         if context.mode != 'EDIT_MESH':
@@ -32,3 +63,8 @@ class REX_OT_toggle_live_unwrap(bpy.types.Operator):
 
         self.report({'INFO'}, f"Live Unwrap {'Enabled' if new_state else 'Disabled'}")
         return {'FINISHED'}
+
+
+def unregister():
+    if bpy.app.timers.is_registered(_apply_pending):
+        bpy.app.timers.unregister(_apply_pending)
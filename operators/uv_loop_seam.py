@@ -20,48 +20,41 @@ class MESH_OT_select_edge_loop_until_seam(bpy.types.Operator):
         return {'FINISHED'}
 
     def select_edge_loop_until_seam(self, context, stop_at_seam):
-        obj = context.active_object
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.edges.ensure_lookup_table()
+        from .mesh_utils import edit_mesh_objects, walk_edge_loop
 
-        selected_edges = [e for e in bm.edges if e.select]
-        if not selected_edges:
-            self.report({'WARNING'}, "No edge selected")
-            return
-
-        start_edge = selected_edges[0]
-
-        bpy.ops.mesh.select_all(action='DESELECT')
-        start_edge.select = True
+        def hits_seam(edge, vert, nxt):
+            # a seam on the next edge or crossing the vertex ends the walk
+            return any(e.seam for e in vert.link_edges if e != edge)
 
-        def traverse(start_loop):
-            current = start_loop
-            for _ in range(1000):
-                try:
-                    n1 = current.link_loop_next
-                    n2 = n1.link_loop_radial_next
-                    next_loop = n2.link_loop_next
+        stop = hits_seam if stop_at_seam else None
 
-                    if next_loop.edge == start_edge or next_loop == current:
-                        break
+        # seeds per object first: the deselect below clears every object in edit mode
+        seeds = []
+        for obj in edit_mesh_objects(context):
+            bm = bmesh.from_edit_mesh(obj.data)
+            selected_edges = [e for e in bm.edges if e.select]
+            if selected_edges:
+                seeds.append((obj, bm, selected_edges))
 
-                    if stop_at_seam and (next_loop.edge.seam or n1.edge.seam):
-                        break
+        if not seeds:
+            self.report({'WARNING'}, "No edge selected")
+            return
 
-                    next_loop.edge.select = True
-                    current = next_loop
-                except AttributeError:
-                    break
+        bpy.ops.mesh.select_all(action='DESELECT')
 
-        if start_edge.link_loops:
-            traverse(start_edge.link_loops[0])
-            if len(start_edge.link_loops) > 1:
-                traverse(start_edge.link_loops[1])
+        for obj, bm, selected_edges in seeds:
+            visited = set()
+            for start_edge in selected_edges:
+                if start_edge in visited:
+                    continue  # already part of a loop walked from another seed
+                loop_edges, _closed = walk_edge_loop(start_edge, stop)
+                visited.update(loop_edges)
 
-        bmesh.update_edit_mesh(obj.data)
-        for edge in bm.edges:
-            if edge.select:
+            # only the walked edges are touched
+            for edge in visited:
+                edge.select_set(True)
                 edge.seam = True  # Mark selected edges as seams
+            bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
                 
 class WM_OT_toggle_stop_at_seam(bpy.types.Operator):
     bl_idname = "wm.toggle_stop_at_seam"
@@ -3,8 +3,10 @@ from gpu_extras.batch import batch_for_shader
 from ..ui import overlay as overlay_drawer
 import time
 import math
+from .mesh_utils import AngleFloodFill, SeedSnapshot, deselect_faces, selected_face_indices
+from .modal_utils import ThrottledModalMixin
 
-class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
+class REXTOOLS3_OT_uvSeamAreaByAngle_modal(ThrottledModalMixin, bpy.types.Operator):
     bl_idname = "rextools3.uv_seam_area_by_angle_modal"
     bl_label = "Area Seam by Angle (drag mouse to adjust)"
     bl_options = {'REGISTER', 'UNDO', 'GRAB_CURSOR', 'BLOCKING'}
@@ -20,10 +22,10 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
 
         # store original seeds
         bm = bmesh.from_edit_mesh(obj.data)
-        self.seed_indices = [f.index for f in bm.faces if f.select]
+        self.seeds = SeedSnapshot(bm, 'FACE')
         
         # **VALIDATION**: require at least one face selected
-        if not self.seed_indices:
+        if not len(self.seeds):
             self.report({'WARNING'}, "Please select at least one face to start.") 
             return {'CANCELLED'}
 
@@ -36,6 +38,12 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
         self.option_show_until  = 0.0
         self.clear_inner        = False
 
+        # Angle mode: adjacency is built once, the region grows/shrinks in place
+        self.flood              = AngleFloodFill(bm, self.seeds.indices)
+        self.angle_applied      = None
+        # faces the last Coplanar/Normal pass selected
+        self.similar_selected   = self.seeds.indices.tolist()
+
         # first select
         self._restore_and_select(context)
 
@@ -43,31 +51,68 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
         self._handle = bpy.types.SpaceView3D.draw_handler_add(
             self._draw_overlay, (context,), 'WINDOW', 'POST_PIXEL'
         )
+        self._throttle_start(context)
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
+    def _recompute(self, context):
+        self._restore_and_select(context)
+
     def _restore_and_select(self, context):
-        # reset to original seeds
-        obj = context.object
-        bm  = bmesh.from_edit_mesh(obj.data)
-        for f in bm.faces: f.select = False
-        for idx in self.seed_indices: bm.faces[idx].select = True
-        bmesh.update_edit_mesh(obj.data)
+        if self.mode == 'Angle':
+            self._select_by_angle(context)
+            return
+
+        # reset to original seeds (an angle pass is undone through the flood state)
+        self._restore_seeds(context)
+
+        # selection no longer matches the flood state
+        self.angle_applied = None
 
         # apply based on current mode
-        if self.mode == 'Linked Flat':
-            bpy.ops.mesh.faces_select_linked_flat(sharpness=self.threshold * math.pi)
-        elif self.mode == 'Coplanar':
+        if self.mode == 'Coplanar':
             bpy.ops.mesh.select_similar(type='FACE_COPLANAR', threshold=self.threshold)
         else:  # 'Normal'
             bpy.ops.mesh.select_similar(type='FACE_NORMAL',   threshold=self.threshold)
+        self.similar_selected = selected_face_indices(bmesh.from_edit_mesh(context.object.data))
+
+    def _select_by_angle(self, context):
+        obj   = context.object
+        flood = self.flood
+
+        if self.angle_applied is None:
+            self._restore_seeds(context)
+            self.angle_applied = flood.seed_count
+
+        # only touch the faces that entered or left the region
+        count = flood.count(self.threshold * math.pi)
+        if count > self.angle_applied:
+            for idx in flood.order[self.angle_applied:count]:
+                flood.faces[idx].select_set(True)
+        elif count < self.angle_applied:
+            removed = [flood.faces[idx] for idx in flood.order[count:self.angle_applied]]
+            for f in removed:
+                f.select_set(False)
+            # deselecting drops shared verts/edges, give them back to neighbours
+            for f in removed:
+                for v in f.verts:
+                    for lf in v.link_faces:
+                        if lf.select:
+                            lf.select_set(True)
+        self.angle_applied = count
+
+        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
     def _restore_seeds(self, context):
         obj = context.object
         bm  = bmesh.from_edit_mesh(obj.data)
-        for f in bm.faces: f.select = False
-        for idx in self.seed_indices: bm.faces[idx].select = True
-        bmesh.update_edit_mesh(obj.data)
+        # deselect only what the previous pass selected
+        if self.angle_applied is not None:
+            deselect_faces(bm, self.flood.order[:self.angle_applied])
+        else:
+            deselect_faces(bm, self.similar_selected)
+        self.seeds.restore(bm)
+        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
     def _draw_overlay(self, context):
         sx, sy = self.start_mouse
@@ -78,7 +123,7 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
         od.draw_crosshair((sx, sy), size=5, color=od.Theme.COLOR_INFO)
 
         # decide threshold display range per mode
-        if self.mode == 'Linked Flat':
+        if self.mode == 'Angle':
             thr_value, thr_min, thr_max = self.threshold * 180.0, 0.0, 180.0
         else:
             thr_value, thr_min, thr_max = self.threshold,       0.0, 1.0
@@ -95,10 +140,17 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
         
         # 3. Clear Inner Toggle
         mov.add_bool("Clear Inner", "Press A", self.clear_inner)
+
+        # 4. Recompute latency
+        mov.add_value("Recompute", "Latency", self.latency_summary())
         
         mov.draw()
 
     def modal(self, context, event):
+        # ——— coalesced recompute ———
+        if self._throttle_tick(context, event):
+            return {'RUNNING_MODAL'}
+
         # ——— mode switch on scroll ———
         if event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'} and event.value == 'PRESS':
             if event.type == 'WHEELUPMOUSE':
@@ -107,7 +159,7 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
                 self.type_index = (self.type_index - 1) % len(self.MODES)
             self.mode              = self.MODES[self.type_index]
             self.option_show_until = time.time() + 1.2
-            self._restore_and_select(context)
+            self._request_recompute(context)
             if context.area: context.area.tag_redraw()
             return {'RUNNING_MODAL'}
 
@@ -116,7 +168,7 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
             self.current_mouse = (event.mouse_region_x, event.mouse_region_y)
             dist = abs(self.current_mouse[0] - self.start_mouse[0])
             self.threshold = min(dist * self.sensitivity, 1.0)
-            self._restore_and_select(context)
+            self._request_recompute(context)
             if context.area: context.area.tag_redraw()
             return {'RUNNING_MODAL'}
 
@@ -128,6 +180,9 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
 
         # ——— confirm ———
         if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+            self._throttle_flush(context)
+            self._throttle_stop(context)
+            self._report_latency()
             bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
             if self.clear_inner:
                 bpy.ops.mesh.mark_seam(clear=True)
@@ -137,6 +192,7 @@ class REXTOOLS3_OT_uvSeamAreaByAngle_modal(bpy.types.Operator):
 
         # ——— cancel ———
         if event.type in {'RIGHTMOUSE', 'ESC'}:
+            self._throttle_stop(context)
             self._restore_seeds(context)
             bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
             if context.area: context.area.tag_redraw()
@@ -0,0 +1,236 @@
+import bpy
+import time
+import hashlib
+import numpy as np
+from bpy.app.handlers import persistent
+from .uv_utils import read_edge_seams, read_loop_uvs, loop_arrays, loop_polygons, edge_uv_mismatch, island_label_steps
+
+# Texel density is shown in pixels per (object-space) meter for this texture size
+TEXTURE_SIZE = 1024
+# Resolution of the UV grid used for the overlap estimate
+OVERLAP_GRID = 128
+
+TICK = 0.25      # timer interval (s)
+STEP = 0.01      # timer interval while a compute is split over ticks (s)
+SETTLE = 0.5     # wait this long after the last edit before recomputing (s)
+BUDGET = 0.05    # max time spent computing per tick (s)
+
+_cache = {}      # mesh name -> stats dict
+_dirty = {}      # mesh name -> time it was invalidated
+_running = {}    # mesh name -> [compute steps, seconds spent, arrays key]
+_own_updates = set()  # meshes we just synced from edit mode (that tags an update)
+
+
+def read_mesh_arrays(mesh):
+    """Everything the stats need from ``mesh``, read in one go."""
+    arrays = {"seams": read_edge_seams(mesh), "n_polys": len(mesh.polygons), "uvs": None}
+    if mesh.uv_layers and len(mesh.polygons):
+        arrays["verts"], arrays["edges"], arrays["nxt"] = loop_arrays(mesh)
+        arrays["uvs"] = read_loop_uvs(mesh)
+        arrays["poly_of_loop"] = loop_polygons(mesh)
+        area = np.empty(len(mesh.polygons), dtype=np.float32)
+        mesh.polygons.foreach_get("area", area)
+        arrays["area"] = area
+    return arrays
+
+
+def arrays_key(arrays):
+    """Digest of the mesh arrays, to skip recomputing unchanged meshes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(arrays):
+        value = arrays[name]
+        digest.update(value.tobytes() if isinstance(value, np.ndarray) else repr(value).encode())
+    return digest.digest()
+
+
+def uv_stats_steps(arrays):
+    """Generator computing the stats of ``read_mesh_arrays`` output. Yields
+    between stages and between island labelling rounds; returns the stats."""
+    n_polys = arrays["n_polys"]
+    stats = {
+        "faces": n_polys,
+        "seams": int(np.count_nonzero(arrays["seams"])),
+        "islands": 0,
+        "density_min": 0.0,
+        "density_max": 0.0,
+        "overlap": 0.0,
+    }
+    uvs = arrays["uvs"]
+    if uvs is None:
+        return stats
+
+    nxt, poly_of_loop, area = arrays["nxt"], arrays["poly_of_loop"], arrays["area"]
+    order, first, _, mismatch = edge_uv_mismatch(arrays["verts"], arrays["edges"], nxt, uvs)
+    yield
+    labels = yield from island_label_steps(n_polys, poly_of_loop, order, first, mismatch)
+    stats["islands"] = len(np.unique(labels))
+    yield
+
+    # per-face UV area (shoelace) against the face's 3D area
+    cross = uvs[:, 0] * uvs[nxt, 1] - uvs[nxt, 0] * uvs[:, 1]
+    uv_area = np.abs(np.bincount(poly_of_loop, weights=cross, minlength=n_polys)) * 0.5
+
+    valid = (area > 1e-12) & (uv_area > 0.0)
+    if valid.any():
+        density = np.sqrt(uv_area[valid] / area[valid]) * TEXTURE_SIZE
+        stats["density_min"] = float(density.min())
+        stats["density_max"] = float(density.max())
+    yield
+
+    # overlap estimate: share of UV area whose face centroid lands in a
+    # grid cell that faces from another island also land in
+    totals = np.bincount(poly_of_loop, minlength=n_polys)
+    centroid = np.stack([
+        np.bincount(poly_of_loop, weights=uvs[:, i], minlength=n_polys) for i in (0, 1)
+    ], axis=1) / np.maximum(totals, 1)[:, None]
+    cell_xy = np.clip((centroid * OVERLAP_GRID).astype(np.int64), 0, OVERLAP_GRID - 1)
+    cell = cell_xy[:, 0] * OVERLAP_GRID + cell_xy[:, 1]
+    pairs = np.unique(np.stack([cell, labels.astype(np.int64)], axis=1), axis=0)
+    cells, islands_per_cell = np.unique(pairs[:, 0], return_counts=True)
+    shared = np.isin(cell, cells[islands_per_cell > 1])
+    total_uv = uv_area.sum()
+    if total_uv > 0.0:
+        stats["overlap"] = float(uv_area[shared].sum() / total_uv)
+    return stats
+
+
+def _start_compute(mesh):
+    """Read ``mesh`` and queue its stats for ``_tick``, unless it is
+    unchanged since the cached stats."""
+    start = time.perf_counter()
+    arrays = read_mesh_arrays(mesh)
+    key = arrays_key(arrays)
+    cached = _cache.get(mesh.name)
+    if cached is not None and cached["key"] == key:
+        return
+    _running[mesh.name] = [uv_stats_steps(arrays), time.perf_counter() - start, key]
+
+
+def get_uv_stats(mesh):
+    """Cached stats for ``mesh`` (possibly stale), or None. Cheap enough for draw();
+    queues a compute, spread over timer ticks, when missing."""
+    if mesh.name not in _cache and not is_pending(mesh):
+        _invalidate(mesh.name, settled=True)
+    return _cache.get(mesh.name)
+
+
+def is_pending(mesh):
+    return mesh.name in _dirty or mesh.name in _running
+
+
+def _invalidate(name, settled=False):
+    _dirty[name] = 0.0 if settled else time.perf_counter()
+    _running.pop(name, None)  # its arrays are out of date
+    if not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=TICK)
+
+
+def _edit_object(mesh):
+    for obj in bpy.data.objects:
+        if obj.data == mesh and obj.mode == 'EDIT':
+            return obj
+    return None
+
+
+def _tick():
+    start = time.perf_counter()
+    for name, dirty_time in list(_dirty.items()):
+        if start - dirty_time < SETTLE:
+            continue  # still being edited
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None:
+            del _dirty[name]
+            _cache.pop(name, None)
+        elif time.perf_counter() - start < BUDGET:
+            del _dirty[name]
+            if mesh.is_editmode:
+                # edit-mode changes only reach the mesh once synced
+                obj = _edit_object(mesh)
+                if obj is None:
+                    continue
+                obj.update_from_editmode()
+                _own_updates.add(name)
+            # reading the arrays is the one step that needs the mesh
+            _start_compute(mesh)
+
+    computed = False
+    for name, job in list(_running.items()):
+        steps = job[0]
+        while time.perf_counter() - start < BUDGET:
+            step_start = time.perf_counter()
+            try:
+                next(steps)
+            except StopIteration as done:
+                del _running[name]
+                stats = done.value
+                stats["time_ms"] = (job[1] + time.perf_counter() - step_start) * 1000.0
+                stats["key"] = job[2]
+                _cache[name] = stats
+                computed = True
+                break
+            job[1] += time.perf_counter() - step_start
+        else:
+            break  # out of budget, resume on the next tick
+
+    if computed:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    for region in area.regions:
+                        if region.type == 'UI':
+                            region.tag_redraw()
+    if _running:
+        return STEP
+    return TICK if _dirty else None
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    names = set()
+    for update in depsgraph.updates:
+        data = update.id.original
+        # selection and other non-geometry updates don't change the stats
+        if not update.is_updated_geometry:
+            continue
+        if isinstance(data, bpy.types.Object):
+            if data.type != 'MESH':
+                continue
+            data = data.data
+        elif not isinstance(data, bpy.types.Mesh):
+            continue
+        names.add(data.name)
+
+    for name in names:
+        if name in _own_updates:
+            _own_updates.discard(name)
+        elif name in _cache:
+            # only track meshes a panel has asked about
+            _invalidate(name)
+
+
+@persistent
+def _on_load_post(*args):
+    _cache.clear()
+    _dirty.clear()
+    _running.clear()
+    _own_updates.clear()
+
+
+def register():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    _cache.clear()
+    _dirty.clear()
+    _running.clear()
+    _own_updates.clear()
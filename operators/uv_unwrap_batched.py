@@ -0,0 +1,153 @@
+import bpy
+import time
+from bpy.types import Operator
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty
+from .background_jobs import run_in_workers, append_datablocks, chunked, default_worker_count
+from .uv_utils import visible_selected_meshes, leave_edit_mode, restore_mode, copy_uv_layers
+
+
+class REXTOOLS3_OT_uv_unwrap_batched(Operator):
+    """Unwrap selected meshes in batches, optionally in parallel background Blender processes"""
+    bl_idname = "rextools3.uv_unwrap_batched"
+    bl_label = "Batch Unwrap"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    method: EnumProperty(
+        name="Method",
+        items=[
+            ('ANGLE_BASED', "Angle Based", ""),
+            ('CONFORMAL', "Conformal", ""),
+        ],
+        default='CONFORMAL'
+    )
+    margin: FloatProperty(name="Margin", default=0.001, min=0.0, max=1.0)
+    batch_size: IntProperty(
+        name="Batch Size",
+        description="Objects per batch",
+        default=25,
+        min=1
+    )
+    use_background: BoolProperty(
+        name="Background Workers",
+        description="Unwrap batches in separate background Blender processes and copy the UVs back",
+        default=False
+    )
+    max_workers: IntProperty(
+        name="Workers",
+        description="Background processes running at the same time (0 = half the CPU cores)",
+        default=0,
+        min=0
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(o.type == 'MESH' for o in context.selected_objects)
+
+    def execute(self, context):
+        # one object per mesh datablock, shared meshes are unwrapped once
+        targets = list({o.data.name_full: o for o in visible_selected_meshes(context)}.values())
+        if not targets:
+            self.report({'WARNING'}, "No visible mesh objects selected")
+            return {'CANCELLED'}
+
+        original_active = context.view_layer.objects.active
+        original_selection = list(context.selected_objects)
+        original_mode = leave_edit_mode(context)
+
+        start = time.perf_counter()
+        if self.use_background:
+            timings, failures = self.unwrap_in_workers(targets)
+        else:
+            timings, failures = self.unwrap_in_process(context, targets)
+        elapsed = time.perf_counter() - start
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for obj in original_selection:
+            obj.select_set(True)
+        restore_mode(context, original_active, original_mode or 'OBJECT')
+
+        # Detailed console output
+        print("\n--- RexTools3 Unwrap Summary ---")
+        for label, (count, seconds) in timings.items():
+            per = f", {seconds / count * 1000:.0f} ms/object" if count > 1 else ""
+            print(f"Unwrapped: {label} ({seconds * 1000:.0f} ms{per})")
+        for name, error in failures.items():
+            print(f"FAILED: {name} -> {error}")
+        print("--------------------------------\n")
+
+        from ..core import notify
+        unwrapped = sum(count for count, _ in timings.values())
+        msg = f"Unwrapped {unwrapped} of {len(targets)} meshes in {elapsed:.1f}s."
+        if failures:
+            notify.warning(msg + f" {len(failures)} failed (see console).")
+        else:
+            notify.success(msg)
+        return {'FINISHED'}
+
+    def unwrap_in_process(self, context, targets):
+        """Multi-object unwrap per batch; a failing batch doesn't stop the rest.
+        Timings map a batch label to (object count, seconds for the batch);
+        failures are per object."""
+        timings, failures = {}, {}
+        view_layer = context.view_layer
+        for index, batch in enumerate(chunked(targets, self.batch_size)):
+            label = f"batch {index + 1}: {batch[0].name}"
+            if len(batch) > 1:
+                label += f" +{len(batch) - 1} objects"
+            start = time.perf_counter()
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for obj in batch:
+                obj.select_set(True)
+            view_layer.objects.active = batch[0]
+            try:
+                bpy.ops.object.mode_set(mode='EDIT')
+                bpy.ops.mesh.select_all(action='SELECT')
+                bpy.ops.uv.unwrap(method=self.method, margin=self.margin)
+                timings[label] = (len(batch), time.perf_counter() - start)
+            except Exception as e:
+                for obj in batch:
+                    failures[obj.name] = str(e)
+            finally:
+                if context.active_object and context.active_object.mode != 'OBJECT':
+                    bpy.ops.object.mode_set(mode='OBJECT')
+        return timings, failures
+
+    def unwrap_in_workers(self, targets):
+        """Per-object unwrap in background processes, UV layers copied back.
+        Timings map an object name to (1, seconds in its worker)."""
+        timings, failures = {}, {}
+        by_name = {o.name: o for o in targets}
+
+        def collect(batch):
+            if batch.error:
+                for name in batch.names:
+                    failures[name] = batch.error
+                return
+            done = {n: r for n, r in batch.results.items() if r.get("ok")}
+            for name, result in batch.results.items():
+                if not result.get("ok"):
+                    failures[name] = result.get("error", "unknown error")
+            if not done or not batch.has_output:
+                return
+
+            names = list(done)
+            loaded = append_datablocks(batch.output, "meshes", [done[n]["data"] for n in names])
+            for name, mesh in zip(names, loaded):
+                if mesh is None:
+                    failures[name] = "result mesh missing"
+                    continue
+                if copy_uv_layers(mesh, by_name[name].data):
+                    timings[name] = (1, done[name]["time"])
+                else:
+                    failures[name] = "topology changed in worker"
+                bpy.data.meshes.remove(mesh)
+
+        run_in_workers(
+            'UNWRAP', targets, collect,
+            batch_size=self.batch_size,
+            max_workers=self.max_workers or default_worker_count(),
+            options={"method": self.method, "margin": self.margin},
+        )
+        return timings, failures
@@ -0,0 +1,185 @@
+import bpy
+import numpy as np
+
+
+def visible_selected_meshes(context):
+    return [o for o in context.selected_objects
+            if o.type == 'MESH' and not o.hide_viewport]
+
+
+def unique_meshes(objects):
+    """Mesh datablocks of ``objects``, each shared mesh once."""
+    return list({obj.data.name_full: obj.data for obj in objects}.values())
+
+
+def leave_edit_mode(context):
+    """Go to Object mode so edit-mesh changes are flushed into the mesh data.
+    Returns the mode to restore afterwards, or None if nothing changed."""
+    active = context.active_object
+    if active and active.mode != 'OBJECT':
+        original_mode = active.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        return original_mode
+    return None
+
+
+def restore_mode(context, original_active, original_mode):
+    if original_active and original_active.name in context.view_layer.objects:
+        context.view_layer.objects.active = original_active
+        try:
+            if original_active.mode != original_mode:
+                bpy.ops.object.mode_set(mode=original_mode)
+        except:
+            bpy.ops.object.mode_set(mode='OBJECT')
+    elif context.active_object and context.active_object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def read_edge_seams(mesh):
+    seams = np.zeros(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_seam", seams)
+    return seams
+
+
+def write_edge_seams(mesh, seams):
+    mesh.edges.foreach_set("use_seam", seams)
+    mesh.update()
+
+
+def read_sharp_edges(mesh):
+    """Sharp flags from the ``sharp_edge`` attribute (all False if it is missing)."""
+    sharp = np.zeros(len(mesh.edges), dtype=bool)
+    attr = mesh.attributes.get("sharp_edge")
+    if attr is not None and attr.domain == 'EDGE' and attr.data_type == 'BOOLEAN':
+        attr.data.foreach_get("value", sharp)
+    return sharp
+
+
+def seams_from_sharp(mesh):
+    """Mark every sharp edge as a seam, object-mode only. Returns new seam count."""
+    seams = read_edge_seams(mesh)
+    sharp = read_sharp_edges(mesh)
+    added = int(np.count_nonzero(sharp & ~seams))
+    if added:
+        write_edge_seams(mesh, seams | sharp)
+    return added
+
+
+def clear_seams(mesh):
+    """Clear every seam, object-mode only. Returns cleared seam count."""
+    seams = read_edge_seams(mesh)
+    cleared = int(np.count_nonzero(seams))
+    if cleared:
+        write_edge_seams(mesh, np.zeros(len(seams), dtype=bool))
+    return cleared
+
+
+def copy_uv_layers(source, target):
+    """Copy every UV layer of ``source`` onto ``target`` by name (same loop count).
+    Missing layers are created on ``target``. Returns False if topology differs."""
+    if len(source.loops) != len(target.loops):
+        return False
+    buffer = np.empty(len(source.loops) * 2, dtype=np.float32)
+    for layer in source.uv_layers:
+        dest = target.uv_layers.get(layer.name) or target.uv_layers.new(name=layer.name)
+        if dest is None:
+            continue
+        layer.data.foreach_get("uv", buffer)
+        dest.data.foreach_set("uv", buffer)
+    target.update()
+    return True
+
+
+def loop_arrays(mesh):
+    """Per-loop vertex index, edge index and next-loop index of ``mesh``."""
+    n_loops = len(mesh.loops)
+    verts = np.empty(n_loops, dtype=np.int32)
+    edges = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", verts)
+    mesh.loops.foreach_get("edge_index", edges)
+
+    n_polys = len(mesh.polygons)
+    starts = np.empty(n_polys, dtype=np.int32)
+    totals = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", starts)
+    mesh.polygons.foreach_get("loop_total", totals)
+
+    nxt = np.arange(1, n_loops + 1, dtype=np.int32)
+    nxt[starts + totals - 1] = starts
+    return verts, edges, nxt
+
+
+def read_loop_uvs(mesh, uv_layer=None):
+    layer = uv_layer or mesh.uv_layers.active
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    layer.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2)
+
+
+def edge_uv_mismatch(verts, edges, nxt, uvs, epsilon=1e-5):
+    """Loops grouped by edge and compared with the first loop of their edge.
+
+    Each loop gives its edge's two UV corners, ordered by vertex index so the
+    faces on both sides line up. Returns (loop order sorted by edge, first
+    loop of each loop's edge, edge of each sorted loop, mismatch per sorted
+    loop).
+    """
+    uv_a, uv_b = uvs, uvs[nxt]
+    flip = verts > verts[nxt]
+    corners = np.where(flip[:, None], np.hstack((uv_b, uv_a)), np.hstack((uv_a, uv_b)))
+
+    order = np.argsort(edges, kind='stable')
+    sorted_edges = edges[order]
+    _, group_start, group_count = np.unique(sorted_edges, return_index=True, return_counts=True)
+    first = np.repeat(order[group_start], group_count)
+
+    mismatch = np.any(np.abs(corners[order] - corners[first]) > epsilon, axis=1)
+    return order, first, sorted_edges, mismatch
+
+
+def _edge_uv_mismatch(mesh, uv_layer=None, epsilon=1e-5):
+    """``edge_uv_mismatch`` read from ``mesh``, plus the uvs."""
+    verts, edges, nxt = loop_arrays(mesh)
+    uvs = read_loop_uvs(mesh, uv_layer)
+    return (*edge_uv_mismatch(verts, edges, nxt, uvs, epsilon), uvs)
+
+
+def island_boundary_edges(mesh, uv_layer=None, epsilon=1e-5):
+    """Bool array over edges: True where the faces on either side disagree in UV.
+
+    Mesh boundary edges are never island boundaries.
+    """
+    boundary = np.zeros(len(mesh.edges), dtype=bool)
+    if not mesh.uv_layers or not len(mesh.loops):
+        return boundary
+
+    _, _, sorted_edges, mismatch, _ = _edge_uv_mismatch(mesh, uv_layer, epsilon)
+    boundary[sorted_edges[mismatch]] = True
+    return boundary
+
+
+def loop_polygons(mesh):
+    """Polygon index of every loop."""
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", totals)
+    return np.repeat(np.arange(len(totals), dtype=np.int32), totals)
+
+
+def island_label_steps(n_polys, poly_of_loop, order, first, mismatch):
+    """Generator form of the island labelling: yields after every propagation
+    round so callers can spread the work, returns the label per polygon."""
+    joined = ~mismatch
+    face_a = poly_of_loop[order[joined]]
+    face_b = poly_of_loop[first[joined]]
+
+    # min-label propagation with pointer jumping
+    labels = np.arange(n_polys, dtype=np.int32)
+    while True:
+        low = np.minimum(labels[face_a], labels[face_b])
+        previous = labels.copy()
+        np.minimum.at(labels, face_a, low)
+        np.minimum.at(labels, face_b, low)
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            return labels
+        yield
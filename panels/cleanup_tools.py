@@ -1,4 +1,5 @@
 import bpy
+from ..operators.modifier_audit import draw_modifier_audit
 
 class RexTools3CleanupToolsPanel(bpy.types.Panel):
     bl_label = "Cleanup Tools"
@@ -39,3 +40,7 @@ class RexTools3CleanupToolsPanel(bpy.types.Panel):
         row = box.row(align=True)
         row.prop(common, "clean_modifiers_all", text="All", toggle=True)
         row.prop(common, "clean_modifiers_hidden", text="Hidden", toggle=True)
+        row = box.row()
+        row.label(text="Audit (active)", icon='VIEWZOOM')
+        row.operator("rextools3.audit_modifiers", text="", icon='CONSOLE')
+        draw_modifier_audit(box, context.active_object)
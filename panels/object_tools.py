@@ -19,6 +19,9 @@ class RexTools3ObjectToolsPanel(bpy.types.Panel):
         
         col = layout.column(align=True)
         col.operator("rextools3.apply_modifiers", text="Apply Modifiers", icon='MODIFIER')
+        row = col.row(align=True)
+        row.operator("rextools3.bulk_join", text="Join by Collection", icon='OUTLINER_COLLECTION').group_by = 'COLLECTION'
+        row.operator("rextools3.bulk_join", text="Join by Material", icon='MATERIAL').group_by = 'MATERIAL'
         
         # Ignore List UI in the panel
         box = layout.box()
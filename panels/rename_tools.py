@@ -1,4 +1,5 @@
 import bpy
+from ..operators.object_auto_rename_low_high import MESH_OT_auto_rename_high_low, origin_write_cost
 
 
 class RexTools3RenameToolsPanel(bpy.types.Panel):
@@ -51,6 +52,23 @@ class RexTools3RenameToolsPanel(bpy.types.Panel):
         
         layout.prop(props, "high_prefix")
         layout.prop(props, "low_prefix")
+        layout.prop(props, "origin_mode")
+
+        if len(selected_meshes) == 2:
+            _, high_poly = MESH_OT_auto_rename_high_low.detect_low_high(selected_meshes, context)
+            count, size = origin_write_cost(high_poly, props.origin_mode)
+            if count:
+                layout.label(text=f"Writes {count:,} verts (~{size / 1048576:.1f} MB)", icon='INFO')
+            else:
+                layout.label(text="No vertex writes (parented)", icon='INFO')
 
         layout.separator()
         layout.operator("mesh.auto_rename_high_low", text="Auto Rename High/Low", icon='FILE_REFRESH')
+
+        box = layout.box()
+        box.label(text="Batch Pairs", icon='LINKED')
+        row = box.row(align=True)
+        op = row.operator("mesh.batch_rename_high_low", text="Preview", icon='VIEWZOOM')
+        op.dry_run = True
+        op = row.operator("mesh.batch_rename_high_low", text="Rename Pairs", icon='FILE_REFRESH')
+        op.dry_run = False
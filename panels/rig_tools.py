@@ -1,5 +1,26 @@
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, UIList
+from ..operators.rig_batch_rename_bones import get_rename_plan
+
+
+class BONE_UL_rename_preview(UIList):
+    """Renamed bones of the active armature, old -> new, from the cached plan"""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        plan = get_rename_plan(context.active_object, context.scene.bone_rename_props)
+        new_name = plan.rename_map.get(item.name, item.name)
+        if item.name in plan.collisions:
+            icon = 'ERROR'
+        elif item.name in plan.cycles:
+            icon = 'FILE_REFRESH'
+        else:
+            icon = 'BONE_DATA'
+        layout.label(text=f"{item.name} → {new_name}", icon=icon)
+
+    def filter_items(self, context, data, propname):
+        plan = get_rename_plan(context.active_object, context.scene.bone_rename_props)
+        return plan.filter_flags(self.bitflag_filter_item), []
+
 
 class VIEW3D_PT_bone_batch_rename(Panel):
     bl_label = "Bone Batch Rename"
@@ -30,6 +51,7 @@ class VIEW3D_PT_bone_batch_rename(Panel):
         col = box.column(align=True)
         col.prop(props, "find_text")
         col.prop(props, "replace_text")
+        col.prop(props, "use_regex")
 
         box = layout.box()
         box.label(text="Prefix & Suffix:", icon='PLUS')
@@ -46,40 +68,23 @@ class VIEW3D_PT_bone_batch_rename(Panel):
         if has_find_replace or has_prefix_suffix:
             box = layout.box()
             box.label(text="Preview:", icon='ZOOM_IN')
-            preview_count = 0
-
-            for bone in armature.data.bones:
-                old_name = bone.name
-                new_name = old_name
-                should_show = False
-                found_match = False
-
-                if has_find_replace and props.find_text in old_name:
-                    new_name = new_name.replace(props.find_text, props.replace_text)
-                    should_show = True
-                    found_match = True
-
-                if has_prefix_suffix:
-                    should_apply = props.apply_prefix_suffix_to_matches_only and found_match or not props.apply_prefix_suffix_to_matches_only
-                    if should_apply:
-                        if props.prefix_text:
-                            new_name = props.prefix_text + new_name
-                        if props.suffix_text:
-                            new_name = new_name + props.suffix_text
-                        should_show = True
-
-                if should_show and new_name != old_name:
-                    preview_count += 1
-                    if preview_count <= 5:
-                        row = box.row()
-                        row.scale_y = 0.8
-                        row.label(text=f"{old_name} → {new_name}", icon='BONE_DATA')
-
-            if preview_count > 5:
-                box.label(text=f"... and {preview_count - 5} more", icon='THREE_DOTS')
-            elif preview_count == 0:
+            plan = get_rename_plan(armature, props)
+
+            if plan.error:
+                box.label(text=f"Invalid find/replace: {plan.error}", icon='ERROR')
+            elif not plan.rename_map:
                 msg = "No matches found" if has_find_replace else "Will add prefix/suffix to all bones"
                 box.label(text=msg, icon='INFO')
+            else:
+                box.label(text=f"{len(plan.rename_map)} bone(s) renamed")
+                if plan.collisions:
+                    box.label(text=f"{len(plan.collisions)} collide and will be auto-suffixed", icon='ERROR')
+                if plan.cycles:
+                    box.label(text=f"{len(plan.cycles)} swap names in a cycle", icon='FILE_REFRESH')
+                box.template_list(
+                    "BONE_UL_rename_preview", "", armature.data, "bones",
+                    context.window_manager, "bone_rename_preview_index", rows=8
+                )
 
         layout.separator()
 
@@ -87,10 +92,12 @@ class VIEW3D_PT_bone_batch_rename(Panel):
         row.scale_y = 1.5
         row.enabled = has_find_replace or has_prefix_suffix
         row.operator("armature.batch_rename_bones", icon='FILE_REFRESH')
+        layout.prop(props, "update_unused_actions")
 
         box = layout.box()
         box.label(text="Info:", icon='INFO')
         col = box.column(align=True)
         col.scale_y = 0.8
         col.label(text="• Vertex groups will be automatically updated")
+        col.label(text="• All selected armatures are renamed")
         col.label(text="• Make sure to be in Object mode")
\ No newline at end of file
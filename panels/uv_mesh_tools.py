@@ -1,4 +1,5 @@
 import bpy
+from .uv_tools import draw_uv_stats
 
 class REXTools3MeshUVPanel(bpy.types.Panel):
     bl_label = "UV Tools"
@@ -54,6 +55,8 @@ class REXTools3MeshUVPanel(bpy.types.Panel):
         )
         box.operator_context = 'EXEC_DEFAULT'
         box.operator("uv.follow_active_quads", text="Quad Follow").mode = 'LENGTH_AVERAGE'
+
+        draw_uv_stats(layout, context.active_object)
         
             
 
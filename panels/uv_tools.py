@@ -1,4 +1,27 @@
 import bpy
+from ..operators.uv_stats import get_uv_stats, is_pending
+
+
+def draw_uv_stats(layout, obj):
+    """Cached UV statistics of the active mesh (computed over timer ticks)."""
+    box = layout.box()
+    box.label(text="Stats", icon='INFO')
+    if not obj or obj.type != 'MESH':
+        box.label(text="No active mesh")
+        return
+
+    stats = get_uv_stats(obj.data)
+    if stats is None:
+        box.label(text="Computing...")
+        return
+
+    col = box.column(align=True)
+    col.label(text=f"Islands: {stats['islands']}    Seams: {stats['seams']}")
+    col.label(text=f"Texel: {stats['density_min']:.0f} - {stats['density_max']:.0f} px/m @1K")
+    col.label(text=f"Overlap (est.): {stats['overlap'] * 100:.1f}%")
+    if is_pending(obj.data):
+        col.label(text="Updating...", icon='TIME')
+
 
 class REXTools3UVPanel(bpy.types.Panel):
     bl_label = "UV Tools"
@@ -20,3 +43,11 @@ class REXTools3UVPanel(bpy.types.Panel):
         box.label(text="Seams", icon='STRANDS')
         col = box.column(align=True)
         col.operator("rextools3.uv_from_sharp", text="Seam From Sharp", icon='MOD_EDGESPLIT')
+
+        # Section 2: Unwrap
+        box = layout.box()
+        box.label(text="Unwrap", icon='UV')
+        col = box.column(align=True)
+        col.operator("rextools3.uv_unwrap_batched", text="Batch Unwrap", icon='MOD_UVPROJECT')
+
+        draw_uv_stats(layout, context.active_object)
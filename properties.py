@@ -443,12 +443,32 @@ class BoneRenameProperties(PropertyGroup):
     prefix_text: StringProperty(name="Prefix", default="")
     suffix_text: StringProperty(name="Suffix", default="")
     apply_prefix_suffix_to_matches_only: BoolProperty(default=False)
+    use_regex: BoolProperty(
+        name="Regex",
+        description="Find is a regular expression, Replace can use capture groups (\\1, \\g<name>)",
+        default=False
+    )
+    update_unused_actions: BoolProperty(
+        name="Unused Actions",
+        description="Also rewrite bone names in F-curves of actions nothing is using, when every bone they animate exists on the renamed armature (assigned actions are always updated)",
+        default=False
+    )
 
 
 class HighLowRenamerProperties(PropertyGroup):
     obj_name: StringProperty(name="Object Name", default="")
     high_prefix: StringProperty(name="High Prefix", default="_high")
     low_prefix: StringProperty(name="Low Prefix", default="_low")
+    origin_mode: EnumProperty(
+        name="Origin",
+        description="How the high poly's origin is moved onto the low poly's",
+        items=[
+            ('AUTO', "Auto", "Transform single-user meshes, parent shared ones"),
+            ('TRANSFORM', "Transform", "Rewrite the high poly's vertices (affects every user of the mesh)"),
+            ('PARENT', "Parent", "Parent the high poly to an empty at the low poly's origin, mesh untouched"),
+        ],
+        default='AUTO'
+    )
 
 
 class PBRMaterialSettings(PropertyGroup):
@@ -848,6 +868,7 @@ def register_properties():
     wm.modal_y = IntProperty(name="Mouse Y", default=0)
 
     bpy.types.Scene.bone_rename_props     = PointerProperty(type=BoneRenameProperties)
+    wm.bone_rename_preview_index = IntProperty(name="Preview Index", default=0)
     bpy.types.Scene.highlow_renamer_props = PointerProperty(type=HighLowRenamerProperties)
 
     wm.select_similar_threshold   = FloatProperty(name="Threshold", default=0.0, min=0.0, max=1.0)
@@ -883,6 +904,7 @@ def unregister_properties():
     del wm.modal_y
 
     del bpy.types.Scene.bone_rename_props
+    del wm.bone_rename_preview_index
     del bpy.types.Scene.highlow_renamer_props
 
     del wm.select_similar_threshold
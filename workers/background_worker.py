@@ -0,0 +1,120 @@
+# Entry point for background Blender workers started by background_jobs.py.
+#
+#   blender --background --factory-startup --python background_worker.py -- spec.json
+#
+# Runs with plain bpy (the add-on is not loaded), so it must not import
+# anything from the package. This folder has no __init__.py, so auto_load
+# never imports it into the add-on.
+import bpy
+import json
+import sys
+import time
+
+
+def _load_objects(path, names):
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        data_to.objects = list(names)
+
+    collection = bpy.context.scene.collection
+    loaded = {}
+    for name, obj in zip(names, data_to.objects):
+        if obj is None:
+            continue
+        collection.objects.link(obj)
+        loaded[name] = obj
+    return loaded
+
+
+def _activate(obj):
+    view_layer = bpy.context.view_layer
+    for other in view_layer.objects:
+        other.select_set(False)
+    obj.select_set(True)
+    view_layer.objects.active = obj
+
+
+def _back_to_object_mode():
+    obj = bpy.context.object
+    if obj and obj.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def job_unwrap(objects, options):
+    """Unwrap each object on its own so one bad mesh only fails itself."""
+    results = {}
+    datablocks = set()
+    for name, obj in objects.items():
+        start = time.perf_counter()
+        try:
+            _activate(obj)
+            bpy.ops.object.mode_set(mode='EDIT')
+            bpy.ops.mesh.select_all(action='SELECT')
+            bpy.ops.uv.unwrap(
+                method=options.get("method", 'CONFORMAL'),
+                margin=options.get("margin", 0.001),
+            )
+            bpy.ops.object.mode_set(mode='OBJECT')
+            # only UVs travel back, don't drag materials along
+            obj.data.materials.clear()
+            datablocks.add(obj.data)
+            results[name] = {"ok": True, "data": obj.data.name, "time": time.perf_counter() - start}
+        except Exception as e:
+            _back_to_object_mode()
+            results[name] = {"ok": False, "error": str(e), "time": time.perf_counter() - start}
+    return results, datablocks
+
+
+def job_apply_modifiers(objects, options):
+    """Bake each object's evaluated mesh (one depsgraph evaluation for all)."""
+    # modifier targets (boolean cutters, curves...) come along in the file
+    # but are only evaluated when they are in the scene
+    collection = bpy.context.scene.collection
+    for obj in bpy.data.objects:
+        if not obj.users_collection:
+            collection.objects.link(obj)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    results = {}
+    datablocks = set()
+    for name, obj in objects.items():
+        start = time.perf_counter()
+        try:
+            mesh = bpy.data.meshes.new_from_object(
+                obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+            )
+            # the add-on relinks its own materials, don't drag copies along
+            materials = [m.name if m else None for m in mesh.materials]
+            mesh.materials.clear()
+            datablocks.add(mesh)
+            results[name] = {
+                "ok": True, "data": mesh.name, "materials": materials,
+                "time": time.perf_counter() - start,
+            }
+        except Exception as e:
+            results[name] = {"ok": False, "error": str(e), "time": time.perf_counter() - start}
+    return results, datablocks
+
+
+JOBS = {
+    'UNWRAP': job_unwrap,
+    'APPLY_MODIFIERS': job_apply_modifiers,
+}
+
+
+def main():
+    spec_path = sys.argv[sys.argv.index("--") + 1]
+    with open(spec_path) as f:
+        spec = json.load(f)
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    objects = _load_objects(spec["input"], spec["objects"])
+    results, datablocks = JOBS[spec["job"]](objects, spec.get("options", {}))
+
+    if datablocks:
+        bpy.data.libraries.write(spec["output"], datablocks, fake_user=True)
+    with open(spec["report"], "w") as f:
+        json.dump({"results": results}, f)
+
+
+if __name__ == "__main__":
+    main()